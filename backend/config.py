@@ -1,12 +1,30 @@
 """Configuration management for the dashboard backend."""
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+def _parse_miners(miners_str: str) -> Dict[str, str]:
+    """Parse a "name:Display Name,name2" list into miner_name -> display_name."""
+    miners = {}
+    for pair in miners_str.split(","):
+        name, sep, display = pair.partition(":")
+        name = name.strip()
+        miners[name] = display.strip() if sep else name.title()
+    return miners
+
+
+def _has_prediction_csv(miner_path: str) -> bool:
+    """Check if a miner directory has my_predictions_history.csv (or the old miner_predictions_history.csv)."""
+    return (os.path.exists(os.path.join(miner_path, "my_predictions_history.csv"))
+            or os.path.exists(os.path.join(miner_path, "miner_predictions_history.csv")))
+
+
 class Config:
     """Application configuration."""
     
@@ -17,6 +35,8 @@ class Config:
     # Real price CSV files path (relative to project root)
     # Points to precog_lstm/data/real_price directory
     REAL_PRICE_DIR: str = os.getenv("REAL_PRICE_DIR", "../precog_lstm/data/real_price")
+    # Parsed price columns are cached here across restarts (set to an empty string to disable)
+    PRICE_CACHE_DIR: str = os.getenv("PRICE_CACHE_DIR", str(Path.home() / ".cache" / "miner_dashboard"))
     
     # Dashboard Configuration
     DASHBOARD_HOST: str = os.getenv("DASHBOARD_HOST", "0.0.0.0")
@@ -27,74 +47,128 @@ class Config:
     ).split(",")
     
     # Miner Configuration
-    MINERS: Dict[str, str] = {}
-    _miners_str = os.getenv("MINERS", "miner1:Miner 1,miner2:Miner 2")
-    for pair in _miners_str.split(","):
-        if ":" in pair:
-            name, display = pair.split(":", 1)
-            MINERS[name.strip()] = display.strip()
-        else:
-            MINERS[pair.strip()] = pair.strip().title()
+    MINERS: Dict[str, str] = _parse_miners(os.getenv("MINERS", "miner1:Miner 1,miner2:Miner 2"))
     
     # File Watching (optional - for watching CSV changes)
     POLL_INTERVAL_SECONDS: float = float(os.getenv("POLL_INTERVAL_SECONDS", "60"))  # 60 seconds default
     MAX_HISTORICAL_ROWS: int = int(os.getenv("MAX_HISTORICAL_ROWS", "1000"))
+    # Store per-asset prediction/interval columns as float32 in memory (set to "false" for full precision)
+    STORE_FLOAT32: bool = os.getenv("STORE_FLOAT32", "true").lower() in ("1", "true", "yes")
+    
+    # Discovery caches, valid for (monotonic time, (st_mtime_ns, st_ino) of miner dir)
+    _discover_cache_key: Optional[Tuple[float, Optional[Tuple[int, int]]]] = None
+    _discover_cache: Optional[Dict[str, str]] = None
+    # Resolved CSV path per miner, invalidated together with the discovery cache
+    _csv_path_cache: Dict[str, str] = {}
+    # get_all_miners result, reused for ALL_MINERS_CACHE_SECONDS: (monotonic time, miners)
+    ALL_MINERS_CACHE_SECONDS: float = 5.0
+    _all_miners_cache: Optional[Tuple[float, Dict[str, str]]] = None
+    
+    @classmethod
+    def _check_discover_cache(cls) -> Optional[Tuple[int, int]]:
+        """
+        Validate the discovery caches against the miner directory.
+        
+        Clears the caches when the directory's mtime/inode changed or the cache is older
+        than POLL_INTERVAL_SECONDS (new CSV files inside an existing miner directory do not
+        touch the parent's mtime).
+        
+        Returns:
+            The current (st_mtime_ns, st_ino) signature, or None if the directory is missing
+        """
+        try:
+            stat = os.stat(cls.get_miner_dir())
+            signature = (stat.st_mtime_ns, stat.st_ino)
+        except OSError:
+            signature = None
+        
+        now = time.monotonic()
+        cache_key = cls._discover_cache_key
+        if cache_key is None or cache_key[1] != signature or now - cache_key[0] >= cls.POLL_INTERVAL_SECONDS:
+            cls._discover_cache_key = (now, signature)
+            cls._discover_cache = None
+            cls._csv_path_cache.clear()
+        
+        return signature
     
     @classmethod
     def get_miner_csv_path(cls, miner_name: str) -> str:
         """Get the local CSV file path for a miner."""
-        # Get project root (parent of backend directory)
-        project_root = Path(__file__).parent.parent
+        cls._check_discover_cache()
+        cached = cls._csv_path_cache.get(miner_name)
+        if cached is not None:
+            return cached
+        
+        miner_path = os.path.join(cls.get_miner_dir(), miner_name)
         # Try my_predictions_history.csv first, fallback to miner_predictions_history.csv
-        csv_path = project_root / cls.MINER_DATA_DIR / miner_name / "my_predictions_history.csv"
-        if not csv_path.exists():
+        csv_path = os.path.join(miner_path, "my_predictions_history.csv")
+        try:
+            os.stat(csv_path)
+        except OSError:
             # Fallback to the old filename
-            csv_path = project_root / cls.MINER_DATA_DIR / miner_name / "miner_predictions_history.csv"
-        return str(csv_path)
+            csv_path = os.path.join(miner_path, "miner_predictions_history.csv")
+        cls._csv_path_cache[miner_name] = csv_path
+        return csv_path
     
     @classmethod
     def discover_miners(cls) -> Dict[str, str]:
         """
         Automatically discover miners from the file system.
         Scans the miner directory for subdirectories containing my_predictions_history.csv files.
+        Results are cached until the directory changes or POLL_INTERVAL_SECONDS elapses.
         
         Returns:
             Dictionary mapping miner_name -> display_name
         """
-        project_root = Path(__file__).parent.parent
-        miner_dir = project_root / cls.MINER_DATA_DIR
+        signature = cls._check_discover_cache()
+        if cls._discover_cache is not None:
+            return cls._discover_cache.copy()
         
         discovered_miners = {}
         
-        if not miner_dir.exists():
+        if signature is None:
+            cls._discover_cache = discovered_miners
+            return discovered_miners.copy()
+        
+        # Scan for miner directories (DirEntry.is_dir uses the cached readdir type;
+        # only symlinked entries need an extra stat)
+        try:
+            with os.scandir(cls.get_miner_dir()) as entries:
+                candidates = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+        except OSError:
             return discovered_miners
         
-        # Scan for miner directories
-        for miner_path in miner_dir.iterdir():
-            if miner_path.is_dir():
-                miner_name = miner_path.name
-                # Try my_predictions_history.csv first, fallback to miner_predictions_history.csv
-                csv_file = miner_path / "my_predictions_history.csv"
-                if not csv_file.exists():
-                    csv_file = miner_path / "miner_predictions_history.csv"
-                
-                # Check if this directory has a valid CSV file
-                if csv_file.exists():
+        # Probe the directories for CSV files concurrently: on network storage each probe
+        # is a round trip, so total latency is the slowest probe rather than their sum
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+                found = list(executor.map(_has_prediction_csv, [path for _, path in candidates]))
+            
+            for (miner_name, _), has_csv in zip(candidates, found):
+                if has_csv:
                     # Use configured display name if available, otherwise generate one
                     display_name = cls.MINERS.get(miner_name, miner_name.replace('_', ' ').title())
                     discovered_miners[miner_name] = display_name
         
-        return discovered_miners
+        cls._discover_cache = discovered_miners
+        return discovered_miners.copy()
     
     @classmethod
     def get_all_miners(cls) -> Dict[str, str]:
         """
         Get all miners (configured + discovered).
         Combines manually configured miners with auto-discovered ones.
+        Called by almost every endpoint, so the result is reused for ALL_MINERS_CACHE_SECONDS
+        without touching the file system.
         
         Returns:
             Dictionary mapping miner_name -> display_name
         """
+        now = time.monotonic()
+        cached = cls._all_miners_cache
+        if cached is not None and now - cached[0] < cls.ALL_MINERS_CACHE_SECONDS:
+            return cached[1].copy()
+        
         # Start with configured miners
         all_miners = cls.MINERS.copy()
         
@@ -102,11 +176,23 @@ class Config:
         discovered = cls.discover_miners()
         all_miners.update(discovered)
         
-        return all_miners
+        cls._all_miners_cache = (now, all_miners)
+        return all_miners.copy()
     
     @classmethod
     def get_real_price_dir(cls) -> Path:
         """Get the real price CSV files directory path."""
         project_root = Path(__file__).parent.parent
         return project_root / cls.REAL_PRICE_DIR
-
+    
+    @classmethod
+    def get_price_cache_dir(cls) -> Optional[Path]:
+        """Get the on-disk price column cache directory (None if disabled)."""
+        if not cls.PRICE_CACHE_DIR:
+            return None
+        return Path(cls.PRICE_CACHE_DIR).expanduser()
+    
+    @classmethod
+    def get_miner_dir(cls) -> str:
+        """Get the miner data directory path."""
+        return os.path.join(str(Path(__file__).parent.parent), cls.MINER_DATA_DIR)
@@ -1,25 +1,151 @@
 """CSV parser for miner prediction history."""
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta, timezone
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional, fall back to the pandas C engine
+    pa = None
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+# Columns read as plain strings (timestamps are parsed by pandas afterwards)
+STRING_COLUMNS = ('timestamp', 'datetime')
+# Low-cardinality string columns read as categoricals (a few distinct values per file)
+CATEGORY_COLUMNS = ('validator_hotkey', 'assets')
+# Float columns of the incentive history CSV
+FLOAT_COLUMNS = ('incentive', 'trust')
+# Column suffixes holding per-asset float values
+FLOAT_COLUMN_SUFFIXES = ('_prediction', '_raw_prediction', '_interval_lower', '_interval_upper')
+
+
+@lru_cache(maxsize=32)
+def _column_dtypes(header: str) -> Dict[str, str]:
+    """Map the known columns of a CSV header line to 'string', 'category' or 'float64' (cached per header)."""
+    dtypes = {}
+    for col in header.split(','):
+        col = col.strip().strip('"')
+        if col in STRING_COLUMNS:
+            dtypes[col] = 'string'
+        elif col in CATEGORY_COLUMNS:
+            dtypes[col] = 'category'
+        elif col in FLOAT_COLUMNS or col.endswith(FLOAT_COLUMN_SUFFIXES):
+            dtypes[col] = 'float64'
+    return dtypes
+
+
+@lru_cache(maxsize=32)
+def _arrow_convert_options(header: str):
+    """Build the Arrow convert options for a CSV header line (cached per header)."""
+    arrow_types = {
+        'string': pa.string(),
+        # Dictionary-encoded strings convert to pandas categoricals
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'float64': pa.float64(),
+    }
+    column_types = {col: arrow_types[dtype] for col, dtype in _column_dtypes(header).items()}
+    return pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+
+
+class _InvalidRowCounter:
+    """Arrow invalid_row_handler that skips malformed rows, counting all but a partially written last line."""
+    
+    def __init__(self, csv_content: bytes):
+        # Text of an unterminated last line (a write in progress), if any
+        last_newline = csv_content.rfind(b'\n')
+        tail = csv_content[last_newline + 1:] if not csv_content.endswith(b'\n') else b''
+        self.partial_last_line = tail.rstrip(b'\r').decode('utf-8', errors='replace') if tail else None
+        self.skipped = 0
+    
+    def __call__(self, row) -> str:
+        if row.text != self.partial_last_line:
+            self.skipped += 1
+        return 'skip'
+
+
+@lru_cache(maxsize=32)
+def _pandas_dtypes(header: str) -> Dict[str, object]:
+    """Build the pandas read_csv dtype map for a CSV header line (cached per header)."""
+    pandas_types = {'string': str, 'category': 'category', 'float64': np.float64}
+    return {col: pandas_types[dtype] for col, dtype in _column_dtypes(header).items()}
+
+
+@lru_cache(maxsize=32)
+def _detect_assets_cached(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Detect assets from a column signature (cached, columns rarely change between polls)."""
+    return tuple(
+        col.replace('_prediction', '')
+        for col in columns
+        if col.endswith('_prediction') and not col.endswith('_raw_prediction')
+    )
+
+
+@lru_cache(maxsize=32)
+def _asset_float_columns(columns: Tuple[str, ...], assets: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Per-asset float columns present in a column signature, in output order (cached)."""
+    present = set(columns)
+    return tuple(
+        f"{asset}{suffix}"
+        for asset in assets
+        for suffix in FLOAT_COLUMN_SUFFIXES
+        if f"{asset}{suffix}" in present
+    )
+
 
 class CSVParser:
     """Parser for miner prediction history CSV files."""
     
     @staticmethod
-    def parse_csv(csv_content: str) -> pd.DataFrame:
-        """Parse CSV content into DataFrame."""
+    def parse_csv(csv_content: Union[bytes, str], source: str = "CSV") -> pd.DataFrame:
+        """
+        Parse CSV content into DataFrame.
+        
+        Malformed rows are skipped with a warning (a partially written last line silently).
+        
+        Args:
+            csv_content: Raw UTF-8 bytes as read from the file (preferred, avoids a
+                decode/encode round trip) or already decoded text
+            source: File the content was read from, for log messages
+        """
         if not csv_content or not csv_content.strip():
             return pd.DataFrame()
         
+        if isinstance(csv_content, str):
+            csv_content = csv_content.encode('utf-8')
+        
+        # Column types of the known columns come from the header, not from type inference
+        header_end = csv_content.find(b'\n')
+        header = (csv_content if header_end == -1 else csv_content[:header_end]).rstrip(b'\r').decode('utf-8')
+        
         try:
-            from io import StringIO
-            df = pd.read_csv(StringIO(csv_content))
+            df = None
+            if pa_csv is not None:
+                try:
+                    # Arrow's multithreaded reader with an explicit schema for the known columns
+                    invalid_rows = _InvalidRowCounter(csv_content)
+                    table = pa_csv.read_csv(
+                        pa.BufferReader(csv_content),
+                        parse_options=pa_csv.ParseOptions(invalid_row_handler=invalid_rows),
+                        convert_options=_arrow_convert_options(header),
+                    )
+                    if invalid_rows.skipped:
+                        logger.warning(f"Skipped {invalid_rows.skipped} malformed row(s) in {source}")
+                    df = table.to_pandas()
+                except pa.ArrowInvalid as e:
+                    # Arrow rejects values that do not fit the schema (e.g. text in a float
+                    # column); the pandas engine with type inference still reads the file
+                    logger.warning(f"Arrow CSV reader failed for {source}, falling back to pandas: {e}")
+                    df = pd.read_csv(BytesIO(csv_content))
+            
+            if df is None:
+                df = pd.read_csv(BytesIO(csv_content), dtype=_pandas_dtypes(header))
             
             # Parse timestamp column - handle ISO8601 format and mixed formats
             if 'timestamp' in df.columns:
@@ -29,18 +155,13 @@ class CSVParser:
             
             return df
         except Exception as e:
-            logger.error(f"Error parsing CSV: {e}")
+            logger.error(f"Error parsing {source}: {e}")
             return pd.DataFrame()
     
     @staticmethod
     def detect_assets(df: pd.DataFrame) -> List[str]:
         """Detect assets from CSV columns."""
-        assets = []
-        for col in df.columns:
-            if col.endswith('_prediction') and not col.endswith('_raw_prediction'):
-                asset_key = col.replace('_prediction', '')
-                assets.append(asset_key)
-        return assets
+        return list(_detect_assets_cached(tuple(df.columns)))
     
     @staticmethod
     def get_latest_predictions(df: pd.DataFrame, limit: int = 100) -> List[Dict]:
@@ -57,38 +178,54 @@ class CSVParser:
             df_sorted = df.iloc[::-1]  # Reverse order
         
         latest = df_sorted.head(limit)
-        
-        predictions = []
         assets = CSVParser.detect_assets(df)
         
-        for _, row in latest.iterrows():
-            pred_data = {
-                'timestamp': row.get('timestamp', row.get('datetime', '')),
-                'datetime': str(row.get('datetime', '')),
-                'validator_hotkey': row.get('validator_hotkey', ''),
-                'assets': row.get('assets', ''),
-                'processing_time_seconds': row.get('processing_time_seconds', 0),
-            }
-            
-            # Add predictions for each asset
-            for asset in assets:
-                pred_col = f"{asset}_prediction"
-                raw_col = f"{asset}_raw_prediction"
-                lower_col = f"{asset}_interval_lower"
-                upper_col = f"{asset}_interval_upper"
-                
-                if pred_col in row:
-                    pred_data[f"{asset}_prediction"] = float(row[pred_col]) if pd.notna(row[pred_col]) else None
-                if raw_col in row:
-                    pred_data[f"{asset}_raw_prediction"] = float(row[raw_col]) if pd.notna(row[raw_col]) else None
-                if lower_col in row:
-                    pred_data[f"{asset}_interval_lower"] = float(row[lower_col]) if pd.notna(row[lower_col]) else None
-                if upper_col in row:
-                    pred_data[f"{asset}_interval_upper"] = float(row[upper_col]) if pd.notna(row[upper_col]) else None
-            
-            predictions.append(pred_data)
+        return CSVParser.predictions_to_records(latest, assets)
+    
+    @staticmethod
+    def predictions_to_records(df: pd.DataFrame, assets: List[str]) -> List[Dict]:
+        """Convert prediction rows to a list of dicts (one dict per row)."""
+        fields = CSVParser.predictions_to_columns(df, assets)
+        keys = list(fields.keys())
+        return [dict(zip(keys, row)) for row in zip(*fields.values())]
+    
+    @staticmethod
+    def predictions_to_columns(df: pd.DataFrame, assets: List[str]) -> Dict[str, list]:
+        """
+        Convert prediction rows to a dict of column name -> list of values.
+        
+        Missing float values become None; asset columns absent from the DataFrame are skipped.
+        """
+        n_rows = len(df)
+        
+        def column_values(col: str, default) -> list:
+            return df[col].tolist() if col in df.columns else [default] * n_rows
         
-        return predictions
+        if 'timestamp' in df.columns:
+            timestamps = df['timestamp'].tolist()
+        else:
+            timestamps = column_values('datetime', '')
+        
+        fields = {
+            'timestamp': timestamps,
+            'datetime': df['datetime'].astype(str).tolist() if 'datetime' in df.columns else [''] * n_rows,
+            'validator_hotkey': column_values('validator_hotkey', ''),
+            'assets': column_values('assets', ''),
+            'processing_time_seconds': column_values('processing_time_seconds', 0),
+        }
+        
+        # Add predictions for each asset: convert all float columns as one block,
+        # then replace only the NaN cells with None
+        float_cols = list(_asset_float_columns(tuple(df.columns), tuple(assets)))
+        if float_cols:
+            block = df[float_cols].to_numpy(dtype=np.float64)
+            columns = block.T.tolist()
+            nan_rows, nan_cols = np.nonzero(np.isnan(block))
+            for i, j in zip(nan_rows.tolist(), nan_cols.tolist()):
+                columns[j][i] = None
+            fields.update(zip(float_cols, columns))
+        
+        return fields
     
     @staticmethod
     def get_new_rows(
@@ -106,20 +243,29 @@ class CSVParser:
         timestamp_col = 'timestamp' if 'timestamp' in new_df.columns else 'datetime'
         
         if timestamp_col not in new_df.columns:
-            # Fallback: compare all rows
-            return new_df[~new_df.isin(old_df).all(axis=1)]
+            # Fallback: compare whole rows by their uint64 hashes
+            old_hashes = pd.util.hash_pandas_object(old_df.reindex(columns=new_df.columns), index=False)
+            new_hashes = pd.util.hash_pandas_object(new_df, index=False)
+            mask = np.isin(new_hashes.to_numpy(), old_hashes.to_numpy(), invert=True)
+            if not mask.any():
+                return pd.DataFrame()
+            return new_df[mask]
         
-        # Get timestamps from both dataframes
-        old_timestamps = set(old_df[timestamp_col].astype(str))
-        new_timestamps = set(new_df[timestamp_col].astype(str))
+        old_ts = old_df[timestamp_col]
+        new_ts = new_df[timestamp_col]
         
-        # Find new timestamps
-        added_timestamps = new_timestamps - old_timestamps
+        if (pd.api.types.is_datetime64_any_dtype(old_ts)
+                and pd.api.types.is_datetime64_any_dtype(new_ts)
+                and old_ts.dtype == new_ts.dtype):
+            # Compare parsed timestamps as int64 nanoseconds
+            mask = np.isin(new_ts.values.view('i8'), old_ts.values.view('i8'), invert=True)
+        else:
+            # Unparsed timestamps: compare string representations
+            mask = ~new_ts.astype(str).isin(set(old_ts.astype(str)))
         
-        if not added_timestamps:
+        if not mask.any():
             return pd.DataFrame()
         
         # Return rows with new timestamps
-        mask = new_df[timestamp_col].astype(str).isin(added_timestamps)
         return new_df[mask]
 
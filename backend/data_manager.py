@@ -1,11 +1,13 @@
 """Data manager for storing and serving miner data."""
 import asyncio
-from typing import Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import logging
 
-from backend.csv_parser import CSVParser
-from backend.metrics import MetricsCalculator
+from backend.config import Config
+from backend.csv_parser import CSVParser, FLOAT_COLUMN_SUFFIXES
 
 logger = logging.getLogger(__name__)
 
@@ -16,53 +18,321 @@ class DataManager:
     def __init__(self):
         self.miner_data: Dict[str, pd.DataFrame] = {}
         self.miner_stats: Dict[str, Dict] = {}
+        # Running aggregates behind miner_stats, updated with appended rows only
+        self._stats_state: Dict[str, Dict] = {}
+        # Timestamps (as int64 ns) already stored per miner, for O(1) duplicate checks
+        self._seen_timestamps: Dict[str, set] = {}
         self._lock = asyncio.Lock()
     
     async def update_miner_data(self, miner_name: str, df: pd.DataFrame):
         """Update data for a miner."""
         async with self._lock:
-            if miner_name in self.miner_data:
-                # Merge with existing data
-                existing = self.miner_data[miner_name]
-                # Combine and remove duplicates
-                combined = pd.concat([existing, df], ignore_index=True)
-                timestamp_col = 'timestamp' if 'timestamp' in combined.columns else 'datetime'
-                if timestamp_col in combined.columns:
-                    combined = combined.drop_duplicates(subset=[timestamp_col], keep='last')
-                    combined = combined.sort_values(timestamp_col, ascending=False)
-                self.miner_data[miner_name] = combined
-            else:
-                self.miner_data[miner_name] = df
+            existing = self.miner_data.get(miner_name)
+            seen = self._seen_timestamps.setdefault(miner_name, set())
+            combined, appended = self._merge_new_rows(existing, df, seen)
+            self.miner_data[miner_name] = combined
             
             # Update stats
-            await self._update_stats(miner_name)
+            await self._update_stats(miner_name, appended)
     
-    async def _update_stats(self, miner_name: str):
-        """Update statistics for a miner."""
+    @staticmethod
+    def _merge_new_rows(
+        existing: Optional[pd.DataFrame],
+        df: pd.DataFrame,
+        seen: set
+    ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """
+        Merge new rows into a miner's data, kept sorted by timestamp (oldest first).
+        
+        Only rows whose timestamp is not already stored are added. When they are all newer
+        than the stored data (the append-only case) they are appended without re-sorting.
+        
+        Args:
+            existing: Stored data for the miner, or None on the first update
+            df: Newly read rows
+            seen: Timestamp keys of the stored rows; updated in place
+        
+        Returns:
+            Tuple of (merged data, rows appended at the end). The appended rows are None
+            when the existing data was replaced or had to be re-sorted.
+        """
+        if Config.STORE_FLOAT32:
+            df = DataManager._to_float32(df)
+        
+        timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
+        has_timestamps = timestamp_col in df.columns
+        
+        if has_timestamps and not df[timestamp_col].is_monotonic_increasing:
+            df = df.sort_values(timestamp_col, kind='stable', ignore_index=True)
+        
+        if existing is None:
+            seen.clear()
+            if has_timestamps:
+                seen.update(DataManager._timestamp_keys(df[timestamp_col]))
+            return df, None
+        
+        if not has_timestamps or timestamp_col not in existing.columns:
+            return DataManager._concat_rows(existing, df), None
+        
+        # Keep only rows with timestamps we have not seen yet (one set lookup per new row,
+        # instead of hashing the whole stored column on every update)
+        keys = DataManager._timestamp_keys(df[timestamp_col])
+        is_new = np.fromiter((key not in seen for key in keys), dtype=bool, count=len(keys))
+        delta = df[is_new]
+        if delta.empty:
+            return existing, delta
+        seen.update(key for key, new in zip(keys, is_new) if new)
+        
+        combined = DataManager._concat_rows(existing, delta)
+        if existing.empty or delta[timestamp_col].iloc[0] >= existing[timestamp_col].iloc[-1]:
+            return combined, delta
+        return combined.sort_values(timestamp_col, kind='stable', ignore_index=True), None
+    
+    @staticmethod
+    def _concat_rows(existing: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+        """Append rows to the stored data, keeping categorical columns categorical."""
+        # pd.concat falls back to object dtype when the categories differ (e.g. a new validator)
+        for col in existing.columns.intersection(rows.columns):
+            old, new = existing[col], rows[col]
+            if (isinstance(old.dtype, pd.CategoricalDtype) and isinstance(new.dtype, pd.CategoricalDtype)
+                    and not old.cat.categories.equals(new.cat.categories)):
+                categories = old.cat.categories.union(new.cat.categories)
+                existing = existing.assign(**{col: old.cat.set_categories(categories)})
+                rows = rows.assign(**{col: new.cat.set_categories(categories)})
+        return pd.concat([existing, rows], ignore_index=True)
+    
+    @staticmethod
+    def _timestamp_keys(timestamps: pd.Series) -> list:
+        """Hashable per-row keys for a timestamp column (int64 nanoseconds for datetimes)."""
+        if timestamps.dtype.kind == 'M':
+            return timestamps.to_numpy(dtype='datetime64[ns]').view('i8').tolist()
+        return timestamps.tolist()
+    
+    @staticmethod
+    def _to_float32(df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast per-asset prediction/interval columns to float32 for storage."""
+        float_cols = {
+            col: np.float32
+            for col in df.columns
+            if col.endswith(FLOAT_COLUMN_SUFFIXES) and df[col].dtype == np.float64
+        }
+        return df.astype(float_cols) if float_cols else df
+    
+    async def _update_stats(self, miner_name: str, appended: Optional[pd.DataFrame] = None):
+        """
+        Update statistics for a miner.
+        
+        Running aggregates are updated from the appended rows only; they are rebuilt from
+        the full history on the first load, after a re-sort, or when the assets change.
+        """
         df = self.miner_data.get(miner_name)
         if df is None or df.empty:
             return
         
         assets = CSVParser.detect_assets(df)
+        state = self._stats_state.get(miner_name)
+        
+        if appended is None or state is None or list(state['assets']) != assets:
+            state = self._new_stats_state(df, assets)
+            self._accumulate_stats(state, df)
+            self._stats_state[miner_name] = state
+        else:
+            self._accumulate_stats(state, appended)
         
         stats = {
             'miner_name': miner_name,
             'total_predictions': len(df),
             'assets': {},
-            'recent_predictions': len(MetricsCalculator.get_recent_predictions(df, hours=24)),
-            'pending_evaluations': len(MetricsCalculator.get_pending_evaluations(df)),
-            'validator_stats': MetricsCalculator.get_validator_stats(df),
+            # Without timestamps every row counts as recent and none as pending
+            'recent_predictions': self._count_since(df, state, timedelta(hours=24), no_timestamp_count=len(df)),
+            'pending_evaluations': self._count_since(df, state, timedelta(hours=1), no_timestamp_count=0),
+            'validator_stats': self._validator_stats(state),
         }
         
         # Stats per asset
         for asset in assets:
             stats['assets'][asset] = {
-                'basic_stats': MetricsCalculator.calculate_basic_stats(df, asset),
-                'trends': MetricsCalculator.calculate_prediction_trends(df, asset),
+                'basic_stats': self._basic_stats(state, asset),
+                'trends': self._prediction_trends(df, state, asset),
             }
         
         self.miner_stats[miner_name] = stats
     
+    @staticmethod
+    def _new_stats_state(df: pd.DataFrame, assets: List[str]) -> Dict:
+        """Create empty running aggregates for a miner's data."""
+        timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
+        return {
+            'timestamp_col': timestamp_col if timestamp_col in df.columns else None,
+            'nat_count': 0,
+            'has_validators': 'validator_hotkey' in df.columns,
+            'validator_counts': {},
+            'has_processing_time': 'processing_time_seconds' in df.columns,
+            'assets': {
+                asset: {
+                    'count': 0,
+                    'prediction_sum': 0.0,
+                    'first_prediction': None,
+                    'latest_prediction': None,
+                    'latest_timestamp': None,
+                    'processing_time_sum': 0.0,
+                    'processing_time_count': 0,
+                    'processing_time_min': np.nan,
+                    'processing_time_max': np.nan,
+                }
+                for asset in assets
+            },
+        }
+    
+    @staticmethod
+    def _accumulate_stats(state: Dict, rows: pd.DataFrame):
+        """Fold rows (in stored order) into a miner's running aggregates."""
+        if rows.empty:
+            return
+        
+        if state['timestamp_col'] in rows.columns:
+            state['nat_count'] += int(rows[state['timestamp_col']].isna().sum())
+        
+        if state['has_validators'] and 'validator_hotkey' in rows.columns:
+            counts = state['validator_counts']
+            for hotkey, count in rows['validator_hotkey'].value_counts(sort=False).items():
+                # Categorical columns also report unused categories with a zero count
+                if count:
+                    counts[hotkey] = counts.get(hotkey, 0) + int(count)
+        
+        latest_col = 'timestamp' if 'timestamp' in rows.columns else 'datetime'
+        if latest_col not in rows.columns:
+            latest_col = None
+        
+        for asset, acc in state['assets'].items():
+            # Appended rows may lack an asset's column (no predictions for it)
+            pred_col = f"{asset}_prediction"
+            if pred_col not in rows.columns:
+                continue
+            values = rows[pred_col].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            valid_idx = np.flatnonzero(valid)
+            if valid_idx.size == 0:
+                continue
+            
+            values = values[valid]
+            if acc['count'] == 0:
+                acc['first_prediction'] = float(values[0])
+            acc['count'] += int(values.size)
+            acc['prediction_sum'] += float(values.sum())
+            acc['latest_prediction'] = float(values[-1])
+            if latest_col is not None:
+                acc['latest_timestamp'] = str(rows[latest_col].iloc[valid_idx[-1]])
+            
+            if state['has_processing_time'] and 'processing_time_seconds' in rows.columns:
+                times = rows['processing_time_seconds'].to_numpy(dtype=np.float64)[valid]
+                times = times[~np.isnan(times)]
+                if times.size:
+                    acc['processing_time_sum'] += float(times.sum())
+                    acc['processing_time_count'] += int(times.size)
+                    acc['processing_time_min'] = float(np.fmin(acc['processing_time_min'], times.min()))
+                    acc['processing_time_max'] = float(np.fmax(acc['processing_time_max'], times.max()))
+    
+    @staticmethod
+    def _count_since(df: pd.DataFrame, state: Dict, window: timedelta, no_timestamp_count: int) -> int:
+        """
+        Count rows newer than now - window (binary search over the sorted timestamps).
+        
+        Args:
+            df: Stored miner data
+            state: The miner's running aggregates
+            window: Age limit of the counted rows
+            no_timestamp_count: Count to return when the data has no timestamp column
+        """
+        timestamp_col = state['timestamp_col']
+        if timestamp_col is None:
+            return no_timestamp_count
+        
+        # Stored data is sorted ascending with NaT rows last
+        n_valid = len(df) - state['nat_count']
+        cutoff = datetime.now(timezone.utc) - window
+        return n_valid - int(df[timestamp_col].iloc[:n_valid].searchsorted(cutoff, side='left'))
+    
+    @staticmethod
+    def _validator_stats(state: Dict) -> Dict:
+        """Get statistics about validators from the running counts."""
+        if not state['has_validators']:
+            return {}
+        
+        counts = state['validator_counts']
+        top_validators = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:5]
+        return {
+            'total_validators': len(counts),
+            'top_validators': [
+                {'hotkey': k[:20] + '...', 'count': int(v)}
+                for k, v in top_validators
+            ],
+        }
+    
+    @staticmethod
+    def _basic_stats(state: Dict, asset: str) -> Dict:
+        """Basic statistics for an asset from the running aggregates."""
+        acc = state['assets'][asset]
+        if acc['count'] == 0:
+            return {
+                'total_predictions': 0,
+                'avg_processing_time': 0,
+            }
+        
+        has_processing_time = state['has_processing_time']
+        if has_processing_time and acc['processing_time_count']:
+            avg_processing_time = acc['processing_time_sum'] / acc['processing_time_count']
+        else:
+            avg_processing_time = np.nan
+        
+        stats = {
+            'total_predictions': acc['count'],
+            'avg_processing_time': float(avg_processing_time) if has_processing_time else 0,
+            'min_processing_time': acc['processing_time_min'] if has_processing_time else 0,
+            'max_processing_time': acc['processing_time_max'] if has_processing_time else 0,
+            'latest_prediction': acc['latest_prediction'],
+        }
+        
+        if acc['latest_timestamp'] is not None:
+            stats['latest_timestamp'] = acc['latest_timestamp']
+        
+        return stats
+    
+    @staticmethod
+    def _prediction_trends(df: pd.DataFrame, state: Dict, asset: str) -> Dict:
+        """Prediction trends for an asset: latest 10 predictions vs. all older ones (or last vs. first)."""
+        acc = state['assets'][asset]
+        count = acc['count']
+        if count < 2:
+            return {}
+        
+        if count >= 10:
+            # Last 10 valid predictions, read from the end of the stored column
+            values = df[f"{asset}_prediction"].to_numpy(dtype=np.float64)
+            window = 20
+            while True:
+                recent = values[-window:]
+                recent = recent[~np.isnan(recent)]
+                if recent.size >= 10 or window >= values.size:
+                    break
+                window *= 2
+            recent = recent[-10:]
+            recent_avg = float(recent.mean())
+            older_avg = (acc['prediction_sum'] - float(recent.sum())) / (count - 10) if count > 10 else np.nan
+        else:
+            recent_avg = acc['latest_prediction']
+            older_avg = acc['first_prediction']
+        
+        trend = recent_avg - older_avg
+        trend_pct = (trend / older_avg * 100) if older_avg != 0 else 0
+        
+        return {
+            'current_prediction': acc['latest_prediction'],
+            'trend': float(trend),
+            'trend_percentage': float(trend_pct),
+            'prediction_count': count,
+        }
+    
     async def get_miner_data(self, miner_name: str) -> Optional[pd.DataFrame]:
         """Get data for a miner."""
         return self.miner_data.get(miner_name)
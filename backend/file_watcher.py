@@ -1,15 +1,117 @@
 """File watcher for monitoring local CSV files."""
 import asyncio
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, Tuple
 from datetime import datetime
+import pandas as pd
 
 from backend.csv_parser import CSVParser
 from backend.config import Config
 
+try:
+    import watchfiles
+except ImportError:  # watchfiles is optional (installed with uvicorn[standard]), fall back to polling
+    watchfiles = None
+
 logger = logging.getLogger(__name__)
 
+# Initial backward read size when tailing CSV files (doubled until enough lines are found)
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+
+def _tail_bytes(fd: int, n_lines: int) -> Tuple[bytes, int]:
+    """
+    Read the header line plus the last n_lines lines of an open file.
+    
+    Reads backwards from the end of the file with a growing buffer, so only the
+    tail is read regardless of the file size.
+    
+    Args:
+        fd: File descriptor to read (with pread, the file position is not used)
+        n_lines: Number of trailing lines (excluding the header) to return
+        
+    Returns:
+        Tuple of (header line followed by the last n_lines lines as raw bytes, offset just
+        past the last byte read). Rows appended after the size check are not included.
+    """
+    size = os.fstat(fd).st_size
+    if size == 0:
+        return b'', 0
+    
+    # Read the header line from the start of the file
+    header = b''
+    offset = 0
+    while offset < size:
+        block = os.pread(fd, _TAIL_CHUNK_SIZE, offset)
+        if not block:
+            break
+        newline = block.find(b'\n')
+        if newline != -1:
+            header += block[:newline + 1]
+            break
+        header += block
+        offset += len(block)
+    header_end = len(header)
+    
+    # Read backwards from the end until n_lines complete lines are buffered
+    chunk = _TAIL_CHUNK_SIZE
+    while True:
+        start = max(header_end, size - chunk)
+        buf = os.pread(fd, size - start, start)
+        # A trailing newline terminates the last line, it does not start a new one
+        search_end = len(buf) - 1 if buf.endswith(b'\n') else len(buf)
+        if buf.count(b'\n', 0, search_end) >= n_lines:
+            pos = search_end
+            for _ in range(n_lines):
+                pos = buf.rfind(b'\n', 0, pos)
+            return header + buf[pos + 1:], start + len(buf)
+        if start == header_end:
+            # Whole file buffered, fewer than n_lines data lines
+            return header + buf, start + len(buf)
+        chunk *= 2
+
+
+def _tail_file(path: Path, n_lines: int) -> bytes:
+    """Open a file and read its header line plus the last n_lines lines (see _tail_bytes)."""
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        return _tail_bytes(fd, n_lines)[0]
+    finally:
+        os.close(fd)
+
+
+def _read_appended_lines(fd: int, offset: int) -> Tuple[bytes, int]:
+    """
+    Read the complete lines appended to an open file after a byte offset.
+    
+    Args:
+        fd: File descriptor to read (with pread, the file position is not used)
+        offset: Byte offset of the first unread line
+        
+    Returns:
+        Tuple of (complete lines, offset just past the last complete line).
+        A trailing partial line is left unread for the next call.
+    """
+    size = os.fstat(fd).st_size
+    if size <= offset:
+        return b'', offset
+    data = os.pread(fd, size - offset, offset)
+    
+    end = data.rfind(b'\n')
+    if end == -1:
+        return b'', offset
+    return data[:end + 1], offset + end + 1
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
 
 class FileWatcher:
     """Watch local CSV files and notify on changes."""
@@ -21,6 +123,12 @@ class FileWatcher:
         self.last_size: Optional[int] = None
         self.last_mtime: Optional[float] = None
         self.last_df = None
+        # Append-only bookkeeping: header line, inode and offset of the first unread line
+        self._header: Optional[bytes] = None
+        self._inode: Optional[int] = None
+        self._offset: int = 0
+        # Long-lived read descriptor, reopened when the path points at a new inode
+        self._fd: Optional[int] = None
         self.running = False
         self._task: Optional[asyncio.Task] = None
     
@@ -49,8 +157,42 @@ class FileWatcher:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        self._close_file()
         logger.info(f"Stopped watching {self.csv_path}")
     
+    def _open_file(self) -> Optional[os.stat_result]:
+        """
+        Stat the CSV path and make sure self._fd refers to the file currently at it.
+        
+        The descriptor is kept open across polls and only reopened when the file was
+        replaced (rotation, atomic rewrite) or deleted.
+        
+        Returns:
+            fstat of the open descriptor, or None if the file does not exist
+        """
+        stat = _stat_or_none(self.csv_path)
+        if stat is None:
+            self._close_file()
+            return None
+        
+        if self._fd is not None:
+            fd_stat = os.fstat(self._fd)
+            if fd_stat.st_ino == stat.st_ino and fd_stat.st_dev == stat.st_dev:
+                return fd_stat
+            self._close_file()
+        
+        try:
+            self._fd = os.open(self.csv_path, os.O_RDONLY | os.O_CLOEXEC)
+        except FileNotFoundError:
+            return None
+        return os.fstat(self._fd)
+    
+    def _close_file(self):
+        """Close the long-lived descriptor, if open."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
     async def _watch_loop(self):
         """Main watching loop."""
         while self.running:
@@ -64,83 +206,115 @@ class FileWatcher:
     async def _check_for_updates(self):
         """Check if file has been updated."""
         try:
-            if not self.csv_path.exists():
+            # Check file modification time and size (off the event loop, stat can block on network filesystems)
+            stat = await asyncio.to_thread(self._open_file)
+            if stat is None:
                 if self.last_size is not None:
                     logger.warning(f"CSV file not found: {self.csv_path}")
                 return
             
-            # Check file modification time and size
-            stat = self.csv_path.stat()
             current_size = stat.st_size
             current_mtime = stat.st_mtime
             
-            # If file changed, read new content
+            # If file changed, read new content (_read_and_process records size/mtime)
             if current_size != self.last_size or current_mtime != self.last_mtime:
-                await self._read_and_process()
-                self.last_size = current_size
-                self.last_mtime = current_mtime
+                await self._read_and_process(stat)
             
         except Exception as e:
             logger.error(f"Error checking for updates: {e}")
     
-    async def _read_and_process(self):
-        """Read CSV file and process updates."""
+    async def _read_and_process(self, stat: Optional[os.stat_result] = None):
+        """Read CSV file and process updates (stat: fstat from a just-made _open_file call)."""
         try:
-            if not self.csv_path.exists():
+            if stat is None:
+                stat = await asyncio.to_thread(self._open_file)
+            if stat is None:
                 logger.warning(f"CSV file does not exist: {self.csv_path}")
                 return
             
-            # Read CSV file
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                # Read last N lines if file is large
-                lines = f.readlines()
-                if len(lines) > Config.MAX_HISTORICAL_ROWS:
-                    csv_content = ''.join(lines[-Config.MAX_HISTORICAL_ROWS:])
-                else:
-                    csv_content = ''.join(lines)
-            
-            if not csv_content:
-                return
-            
-            # Parse CSV
-            new_df = CSVParser.parse_csv(csv_content)
-            
-            if new_df.empty:
-                return
-            
-            # Get new rows if we have previous data
-            if self.last_df is not None:
-                new_rows = CSVParser.get_new_rows(self.last_df, new_df)
-                if not new_rows.empty:
-                    logger.info(f"New predictions detected for {self.miner_name}: {len(new_rows)} rows")
-                    await self.on_update(self.miner_name, new_rows)
+            # The CSV is append-only: parse just the appended bytes unless the file
+            # was truncated or replaced, in which case fall back to re-reading the tail
+            if (self._header is not None and self.last_df is not None
+                    and stat.st_ino == self._inode and stat.st_size >= self._offset):
+                await self._process_appended()
             else:
-                # First read - send all data
-                logger.info(f"Initial load for {self.miner_name}: {len(new_df)} rows")
-                await self.on_update(self.miner_name, new_df)
+                await self._process_tail(stat)
             
-            self.last_df = new_df
+            self.last_size = stat.st_size
+            self.last_mtime = stat.st_mtime
             
         except Exception as e:
             logger.error(f"Error reading/processing CSV for {self.miner_name}: {e}")
     
+    async def _process_tail(self, stat: os.stat_result):
+        """Read the header and last N rows of the CSV file and process them."""
+        # Read header + last N lines (seeks from the end, never reads the whole file)
+        raw_content, end_offset = await asyncio.to_thread(_tail_bytes, self._fd, Config.MAX_HISTORICAL_ROWS)
+        
+        if not raw_content:
+            return
+        
+        # Hold back a partially written last row; it is picked up once complete
+        header_end = raw_content.find(b'\n') + 1
+        partial_len = len(raw_content) - raw_content.rfind(b'\n') - 1
+        if header_end and partial_len:
+            raw_content = raw_content[:-partial_len]
+        
+        # Remember where appended rows will start
+        self._header = raw_content[:header_end] if header_end else None
+        self._inode = stat.st_ino
+        # (measured on the bytes actually read, the file may have grown since it was stat'ed)
+        self._offset = end_offset - partial_len
+        
+        # Parse CSV (in a worker thread, Arrow releases the GIL while parsing)
+        new_df = await asyncio.to_thread(CSVParser.parse_csv, raw_content, str(self.csv_path))
+        
+        if new_df.empty:
+            return
+        
+        # Get new rows if we have previous data
+        if self.last_df is not None:
+            new_rows = CSVParser.get_new_rows(self.last_df, new_df)
+            if not new_rows.empty:
+                logger.info(f"New predictions detected for {self.miner_name}: {len(new_rows)} rows")
+                await self.on_update(self.miner_name, new_rows)
+        else:
+            # First read - send all data
+            logger.info(f"Initial load for {self.miner_name}: {len(new_df)} rows")
+            await self.on_update(self.miner_name, new_df)
+        
+        self.last_df = new_df
+    
+    async def _process_appended(self):
+        """Parse only the rows appended since the last read and process them."""
+        chunk, offset = await asyncio.to_thread(_read_appended_lines, self._fd, self._offset)
+        if not chunk:
+            return
+        
+        new_rows = await asyncio.to_thread(CSVParser.parse_csv, self._header + chunk, str(self.csv_path))
+        self._offset = offset
+        
+        if new_rows.empty:
+            return
+        
+        logger.info(f"New predictions detected for {self.miner_name}: {len(new_rows)} rows")
+        await self.on_update(self.miner_name, new_rows)
+        
+        # Keep the last N rows so a truncated/replaced file can still be diffed
+        self.last_df = pd.concat([self.last_df, new_rows], ignore_index=True).tail(Config.MAX_HISTORICAL_ROWS)
+    
     async def get_current_data(self) -> Optional[object]:
         """Get current data snapshot."""
         try:
-            if not self.csv_path.exists():
+            if await asyncio.to_thread(_stat_or_none, self.csv_path) is None:
                 return None
             
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if len(lines) > Config.MAX_HISTORICAL_ROWS:
-                    csv_content = ''.join(lines[-Config.MAX_HISTORICAL_ROWS:])
-                else:
-                    csv_content = ''.join(lines)
+            raw_content = await asyncio.to_thread(_tail_file, self.csv_path, Config.MAX_HISTORICAL_ROWS)
             
-            if not csv_content:
+            if not raw_content:
                 return None
             
-            df = CSVParser.parse_csv(csv_content)
+            df = await asyncio.to_thread(CSVParser.parse_csv, raw_content, str(self.csv_path))
             return df
             
         except Exception as e:
@@ -164,3 +338,83 @@ class FileWatcher:
                 "miner_name": self.miner_name,
                 "error": str(e)
             }
+
+
+class WatcherPool:
+    """Poll a set of FileWatchers from a single shared task."""
+    
+    def __init__(self, watchers: Optional[Dict[str, FileWatcher]] = None):
+        self.watchers: Dict[str, FileWatcher] = watchers if watchers is not None else {}
+        self.running = False
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+    
+    def add(self, watcher: FileWatcher):
+        """Add a watcher to the pool."""
+        self.watchers[watcher.miner_name] = watcher
+    
+    async def start(self):
+        """Load all watched files, then start the shared polling loop."""
+        if self.running:
+            return
+        
+        self.running = True
+        
+        # Do initial loads concurrently
+        await asyncio.gather(
+            *(watcher._read_and_process() for watcher in self.watchers.values()),
+            return_exceptions=True,
+        )
+        
+        if watchfiles is not None:
+            self._stop_event = asyncio.Event()
+            self._task = asyncio.create_task(self._event_loop())
+        else:
+            self._task = asyncio.create_task(self._poll_loop())
+        logger.info(f"Started watching {len(self.watchers)} miner CSV file(s)")
+    
+    async def stop(self):
+        """Stop the shared polling loop."""
+        self.running = False
+        if self._stop_event:
+            self._stop_event.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Stopped watcher pool")
+    
+    async def _event_loop(self):
+        """Process watchers on file change notifications (inotify/FSEvents) instead of polling."""
+        miner_dir = os.path.realpath(Config.get_miner_dir())
+        try:
+            # One recursive watch on the miner directory covers every miner's CSV file
+            async for changes in watchfiles.awatch(
+                miner_dir,
+                watch_filter=lambda change, path: path.endswith('.csv'),
+                stop_event=self._stop_event,
+            ):
+                changed_paths = {os.path.realpath(path) for _, path in changes}
+                await asyncio.gather(
+                    *(
+                        watcher._check_for_updates()
+                        for watcher in list(self.watchers.values())
+                        if os.path.realpath(watcher.csv_path) in changed_paths
+                    ),
+                    return_exceptions=True,
+                )
+        except Exception as e:
+            logger.warning(f"File change notifications unavailable for {miner_dir}, falling back to polling: {e}")
+            await self._poll_loop()
+    
+    async def _poll_loop(self):
+        """Check all watchers for updates together, once per poll interval."""
+        while self.running:
+            # _check_for_updates logs its own errors; stats run concurrently in worker threads
+            await asyncio.gather(
+                *(watcher._check_for_updates() for watcher in list(self.watchers.values())),
+                return_exceptions=True,
+            )
+            await asyncio.sleep(Config.POLL_INTERVAL_SECONDS)
@@ -1,11 +1,12 @@
 """Main FastAPI application."""
 import asyncio
+import json
 import logging
-from typing import Dict, List
+from typing import Dict, Iterator, List, Set, Tuple
 from pathlib import Path
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 import pandas as pd
@@ -14,13 +15,18 @@ from datetime import timedelta, datetime, timezone
 from typing import Optional
 
 from backend.config import Config
-from backend.file_watcher import FileWatcher
+from backend.file_watcher import FileWatcher, WatcherPool
 from backend.data_manager import DataManager
 from backend.csv_parser import CSVParser
 from backend.metrics import MetricsCalculator
 from backend.price_fetcher import PriceFetcher
 from backend.price_csv_loader import PriceCSVLoader
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard json encoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,7 +35,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
-app = FastAPI(title="Miner Dashboard API", version="1.0.0")
+app = FastAPI(
+    title="Miner Dashboard API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 # CORS middleware
 app.add_middleware(
@@ -44,34 +54,123 @@ app.add_middleware(
 data_manager = DataManager()
 
 # WebSocket connections
-active_connections: List[WebSocket] = []
+active_connections: Set[WebSocket] = set()
 
-# File watchers
+# File watchers (polled together by a single shared task)
 file_watchers: Dict[str, FileWatcher] = {}
+watcher_pool = WatcherPool(file_watchers)
+
+# Parsed miner CSV files: path -> ((st_mtime_ns, st_size, st_ino), DataFrame)
+_csv_cache: Dict[str, Tuple[Tuple[int, int, int], pd.DataFrame]] = {}
+# One row per timestamp, oldest first: miner -> (source DataFrame, derived DataFrame)
+_unique_rows_cache: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
+
+
+# CSV column prefix for a requested asset name
+_ASSET_KEYS = {
+    'btc': 'btc',
+    'eth': 'eth',
+    'tao': 'tao_bittensor',
+    'tao_bittensor': 'tao_bittensor',
+}
+# Price file asset for a requested or CSV asset name
+_API_ASSETS = {
+    'btc': 'btc',
+    'eth': 'eth',
+    'tao': 'tao',
+    'tao_bittensor': 'tao',
+}
+# (prediction, interval lower, interval upper) columns per CSV asset prefix
+_ASSET_COLUMNS = {
+    key: (f"{key}_prediction", f"{key}_interval_lower", f"{key}_interval_upper")
+    for key in set(_ASSET_KEYS.values())
+}
+
+# Types serialize_for_json returns unchanged
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
 
 
 def serialize_for_json(obj):
-    """Recursively serialize objects for JSON."""
-    if isinstance(obj, (pd.Timestamp, pd.DatetimeTZType)):
+    """Recursively serialize objects for JSON (used by dumps_json when orjson is not installed)."""
+    # Exact-type checks first: plain Python values are the common case
+    obj_type = type(obj)
+    if obj_type in _JSON_SCALAR_TYPES:
+        return obj
+    if obj_type is float:
+        return None if obj != obj else obj
+    if obj_type is dict:
+        return {k: serialize_for_json(v) for k, v in obj.items()}
+    if obj_type is list or obj_type is tuple:
+        return [serialize_for_json(item) for item in obj]
+    
+    if isinstance(obj, pd.Timestamp):
         return obj.isoformat()
-    elif isinstance(obj, pd.Series):
-        return obj.tolist()
     elif isinstance(obj, pd.DataFrame):
-        return obj.to_dict('records')
-    elif isinstance(obj, (np.integer, np.floating)):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
+        return serialize_for_json(obj.to_dict('records'))
+    elif isinstance(obj, (pd.Series, np.ndarray)):
+        return serialize_for_json(obj.tolist())
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, (float, np.floating)):
+        return None if np.isnan(obj) else float(obj)
     elif isinstance(obj, dict):
         return {k: serialize_for_json(v) for k, v in obj.items()}
     elif isinstance(obj, (list, tuple)):
         return [serialize_for_json(item) for item in obj]
-    elif pd.isna(obj):
+    elif pd.api.types.is_scalar(obj) and pd.isna(obj):
         return None
     else:
         return obj
 
 
+def _json_default(obj):
+    """Encode the pandas objects orjson does not handle natively."""
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict('records')
+    if isinstance(obj, pd.Series):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json_bytes(obj) -> bytes:
+    """Serialize an object (which may contain pandas/numpy values) to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(serialize_for_json(obj)).encode('utf-8')
+
+
+def dumps_json(obj) -> str:
+    """Serialize an object (which may contain pandas/numpy values) to a JSON string."""
+    return dumps_json_bytes(obj).decode('utf-8')
+
+
+# Rows encoded per chunk when streaming a whole DataFrame as JSON
+_STREAM_CHUNK_ROWS = 5000
+
+
+def _stream_records_json(df: pd.DataFrame, key: str) -> Iterator[bytes]:
+    """
+    Stream {key: [records...]} as JSON, encoding _STREAM_CHUNK_ROWS rows at a time.
+    
+    The response body is the same document a single dumps_json call would produce,
+    but only one chunk of records is materialized at a time.
+    """
+    yield b'{' + dumps_json_bytes(key) + b':['
+    for start in range(0, len(df), _STREAM_CHUNK_ROWS):
+        # Each chunk encodes as a JSON array; strip its brackets and join with commas
+        chunk = dumps_json_bytes(df.iloc[start:start + _STREAM_CHUNK_ROWS])
+        yield (b',' if start else b'') + chunk[1:-1]
+    yield b']}'
+
+
 async def broadcast_update(miner_name: str, data):
     """Broadcast update to all WebSocket connections."""
     if not active_connections:
@@ -81,27 +180,25 @@ async def broadcast_update(miner_name: str, data):
         message = {
             'type': 'update',
             'miner': miner_name,
-            'data': serialize_for_json(data),
+            'data': data,
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
         
-        # Verify JSON serializable
-        import json
-        json.dumps(message)  # Will raise if not serializable
+        # Encode once (raises if not serializable), then send the same text to every client
+        payload = dumps_json(message)
         
-        # Send to all connections
-        disconnected = []
-        for connection in active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"Error sending to WebSocket: {e}")
-                disconnected.append(connection)
+        # Send to all connections concurrently, so a slow client does not hold up the others
+        connections = list(active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
         
         # Remove disconnected connections
-        for conn in disconnected:
-            if conn in active_connections:
-                active_connections.remove(conn)
+        for conn, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error sending to WebSocket: {result}")
+                active_connections.discard(conn)
                 
     except Exception as e:
         logger.error(f"Error broadcasting update: {e}")
@@ -135,9 +232,10 @@ async def startup_event():
     for miner_name in all_miners.keys():
         logger.info(f"Initializing file watcher for {miner_name}...")
         watcher = FileWatcher(miner_name, on_file_update)
-        file_watchers[miner_name] = watcher
-        # Optionally start watching (for real-time updates)
-        # await watcher.start()
+        watcher_pool.add(watcher)
+    
+    # Optionally start watching (for real-time updates)
+    # await watcher_pool.start()
     
     logger.info("✅ Dashboard backend started (reading from local CSV files)")
 
@@ -148,11 +246,12 @@ async def shutdown_event():
     logger.info("Shutting down dashboard backend...")
     
     # Stop all file watchers
+    await watcher_pool.stop()
     for watcher in file_watchers.values():
         await watcher.stop()
     
     # Close all WebSocket connections
-    for connection in active_connections:
+    for connection in list(active_connections):
         try:
             await connection.close()
         except Exception:
@@ -175,26 +274,64 @@ async def health():
     return {"status": "healthy", "miners": list(all_miners.keys())}
 
 
+def _read_csv_cached(csv_path: Path) -> pd.DataFrame:
+    """
+    Read and parse a CSV file, reusing the parsed DataFrame until the file changes.
+    
+    The cache entry is validated against the file's (st_mtime_ns, st_size, st_ino) on
+    every call, so a changed or replaced file is re-read on the next request. The
+    returned DataFrame is shared between requests and must not be modified in place.
+    """
+    # Stat before reading: if the file changes mid-read, the stale signature forces a re-read
+    stat = csv_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cache_key = str(csv_path)
+    
+    cached = _csv_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    # Explicit column types for the known columns, timestamps parsed as UTC
+    df = CSVParser.parse_csv(csv_path.read_bytes(), str(csv_path))
+    
+    _csv_cache[cache_key] = (signature, df)
+    return df
+
+
 def _read_miner_csv(miner_name: str) -> pd.DataFrame:
-    """Read CSV file for a miner."""
+    """Read CSV file for a miner (cached until the file changes, do not modify the result)."""
     csv_path = Path(Config.get_miner_csv_path(miner_name))
     if not csv_path.exists():
         logger.warning(f"CSV file not found: {csv_path}")
         return pd.DataFrame()
     
     try:
-        df = pd.read_csv(csv_path)
-        # Parse timestamp columns - handle ISO8601 format and mixed formats
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, format='ISO8601', errors='coerce')
-        if 'datetime' in df.columns:
-            df['datetime'] = pd.to_datetime(df['datetime'], utc=True, format='ISO8601', errors='coerce')
-        return df
+        return _read_csv_cached(csv_path)
     except Exception as e:
         logger.error(f"Error reading CSV for {miner_name}: {e}")
         return pd.DataFrame()
 
 
+def _unique_rows_asc(miner_name: str, df: pd.DataFrame, timestamp_col: str) -> pd.DataFrame:
+    """
+    Get one row per timestamp sorted oldest first, cached per miner.
+    
+    The cache entry is tied to the DataFrame returned by _read_miner_csv: a re-read CSV
+    is a new object, which invalidates it. Do not modify the result in place.
+    """
+    cached = _unique_rows_cache.get(miner_name)
+    if cached is not None and cached[0] is df:
+        return cached[1]
+    
+    # Keep the first row (in file order) for each timestamp, rows without a timestamp dropped
+    df_unique = df[df[timestamp_col].notna()].drop_duplicates(subset=[timestamp_col], keep='first')
+    # Sort by timestamp (oldest first, the order the chart data is returned in)
+    df_sorted = df_unique.sort_values(timestamp_col, kind='stable')
+    
+    _unique_rows_cache[miner_name] = (df, df_sorted)
+    return df_sorted
+
+
 @app.get("/api/miners")
 async def get_miners():
     """
@@ -253,6 +390,21 @@ async def get_miner_stats(miner_name: str):
     }
 
 
+def _latest_unique_predictions(df: pd.DataFrame, limit: int) -> pd.DataFrame:
+    """Get the latest `limit` predictions, one row per timestamp (most recent first)."""
+    timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
+    if timestamp_col not in df.columns:
+        # Fallback: just get latest predictions without grouping
+        return df.iloc[::-1].head(limit)
+    
+    # Keep the first row (in file order) for each timestamp
+    # This handles the case where up to 5 predictions exist per timestamp
+    df_unique = df.drop_duplicates(subset=[timestamp_col], keep='first')
+    
+    # Latest N unique timestamps, most recent first (partial sort, O(N log limit))
+    return df_unique.nlargest(limit, timestamp_col)
+
+
 @app.get("/api/miners/{miner_name}/predictions")
 async def get_predictions(miner_name: str, limit: int = 50):
     """Get latest predictions for a miner.
@@ -272,55 +424,96 @@ async def get_predictions(miner_name: str, limit: int = 50):
     if df.empty:
         return {"predictions": []}
     
-    # Group by timestamp first, then get latest unique timestamps
-    timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
-    if timestamp_col not in df.columns:
-        # Fallback: just get latest predictions without grouping
-        predictions = CSVParser.get_latest_predictions(df, limit=limit)
-        return {"predictions": predictions}
+    # One row per timestamp (falls back to the latest rows without a timestamp column)
+    df_latest = _latest_unique_predictions(df, limit)
     
-    # Group by timestamp and take the first row for each timestamp
-    # This handles the case where up to 5 predictions exist per timestamp
-    df_grouped = df.groupby(timestamp_col).first().reset_index()
+    # Convert to list of dicts (float columns converted as one block, NaN -> None)
+    predictions = CSVParser.predictions_to_records(df_latest, CSVParser.detect_assets(df))
     
-    # Sort by timestamp (most recent first)
-    df_sorted = df_grouped.sort_values(timestamp_col, ascending=False)
+    return {"predictions": predictions}
+
+
+@app.get("/api/v2/miners/{miner_name}/predictions")
+async def get_predictions_columnar(miner_name: str, limit: int = 50):
+    """Get latest predictions for a miner in columnar form.
     
-    # Get latest N unique timestamps
-    df_latest = df_sorted.head(limit)
+    Same rows as /api/miners/{miner_name}/predictions, but returned as
+    {"columns": [...], "data": [[column values], ...]} instead of one dict per row.
+    """
+    # Check if miner exists (either configured or discovered)
+    all_miners = Config.get_all_miners()
+    if miner_name not in all_miners:
+        raise HTTPException(status_code=404, detail="Miner not found")
     
-    # Convert to list of dicts
-    predictions = []
-    assets = CSVParser.detect_assets(df)
+    # Read CSV file
+    df = _read_miner_csv(miner_name)
     
-    for _, row in df_latest.iterrows():
-        pred_data = {
-            'timestamp': row.get('timestamp', row.get('datetime', '')),
-            'datetime': str(row.get('datetime', '')),
-            'validator_hotkey': row.get('validator_hotkey', ''),
-            'assets': row.get('assets', ''),
-            'processing_time_seconds': row.get('processing_time_seconds', 0),
-        }
+    if df.empty:
+        return {"columns": [], "data": []}
+    
+    df_latest = _latest_unique_predictions(df, limit)
+    fields = CSVParser.predictions_to_columns(df_latest, CSVParser.detect_assets(df))
+    
+    return {"columns": list(fields.keys()), "data": list(fields.values())}
+
+
+def _isoformat_utc(timestamps) -> List[str]:
+    """
+    Format UTC timestamps like Timestamp.isoformat(), vectorized for whole-second values.
+    
+    Args:
+        timestamps: tz-aware Series/DatetimeIndex without NaT
         
-        # Add predictions for each asset
-        for asset in assets:
-            pred_col = f"{asset}_prediction"
-            raw_col = f"{asset}_raw_prediction"
-            lower_col = f"{asset}_interval_lower"
-            upper_col = f"{asset}_interval_upper"
-            
-            if pred_col in row:
-                pred_data[f"{asset}_prediction"] = float(row[pred_col]) if pd.notna(row[pred_col]) else None
-            if raw_col in row:
-                pred_data[f"{asset}_raw_prediction"] = float(row[raw_col]) if pd.notna(row[raw_col]) else None
-            if lower_col in row:
-                pred_data[f"{asset}_interval_lower"] = float(row[lower_col]) if pd.notna(row[lower_col]) else None
-            if upper_col in row:
-                pred_data[f"{asset}_interval_upper"] = float(row[upper_col]) if pd.notna(row[upper_col]) else None
+    Returns:
+        ISO 8601 strings such as '2024-01-01T12:00:00+00:00'
+    """
+    index = pd.DatetimeIndex(timestamps)
+    ns = index.asi8
+    if str(index.tz) == 'UTC' and not (ns % 10**9).any():
+        # One NumPy call instead of a Python isoformat() per value
+        seconds = index.tz_localize(None).to_numpy(dtype='datetime64[s]')
+        return np.char.add(np.datetime_as_string(seconds, unit='s'), '+00:00').tolist()
+    return [ts.isoformat() for ts in index]
+
+
+def _float_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Column values as a float64 array, NaN for missing values (all NaN if the column is missing)."""
+    if col not in df.columns:
+        return np.full(len(df), np.nan)
+    return df[col].to_numpy(dtype=np.float64)
+
+
+def _unique_values_history(df: pd.DataFrame, timestamp_col: str, value_col: str, limit: int) -> List[Dict]:
+    """
+    Get one point per unique value at each of the latest `limit` timestamps.
+    
+    Args:
+        df: Incentive history DataFrame (parsed timestamps)
+        timestamp_col: Timestamp column to group by
+        value_col: Value column ('incentive' or 'trust')
+        limit: Number of latest timestamps to include, and maximum number of points returned
         
-        predictions.append(pred_data)
+    Returns:
+        List of {'timestamp', 'datetime', value_col} dicts sorted by timestamp (oldest first),
+        then by value (highest first)
+    """
+    # Latest N unique timestamps (partial sort, O(N log limit))
+    latest = df[timestamp_col].dropna().drop_duplicates().nlargest(limit)
     
-    return {"predictions": predictions}
+    # Unique (timestamp, value) pairs at those timestamps
+    points = df.loc[df[timestamp_col].isin(latest), [timestamp_col, value_col]].dropna().drop_duplicates()
+    points = points.sort_values([timestamp_col, value_col], ascending=[True, False])
+    
+    history = [
+        {'timestamp': timestamp_str, 'datetime': timestamp_str, value_col: value}
+        for timestamp_str, value in zip(
+            _isoformat_utc(points[timestamp_col]),
+            points[value_col].astype(float).tolist(),
+        )
+    ]
+    
+    # Limit to requested number (take the most recent N)
+    return history[-limit:]
 
 
 @app.get("/api/miners/{miner_name}/incentives")
@@ -341,61 +534,9 @@ async def get_miner_incentives(miner_name: str, limit: int = 50):
     if timestamp_col not in df.columns:
         return {"incentives": []}
     
-    # Get unique incentive values per timestamp to show more data points
-    # Group by timestamp and get all unique incentive values, sorted
-    grouped = df.groupby(timestamp_col)['incentive'].apply(lambda x: sorted(x.unique(), reverse=True)).reset_index()
-    grouped = grouped.sort_values(timestamp_col, ascending=False).head(limit)
-    
-    # Convert to list of dicts - create a point for each unique incentive value
-    incentives = []
-    for _, row in grouped.iterrows():
-        timestamp = row[timestamp_col]
-        if pd.isna(timestamp):
-            continue
-        
-        # Convert to ISO format
-        if isinstance(timestamp, pd.Timestamp):
-            timestamp_str = timestamp.isoformat()
-        else:
-            try:
-                ts = pd.to_datetime(timestamp, utc=True)
-                timestamp_str = ts.isoformat()
-            except:
-                continue
-        
-        # Add a point for each unique incentive value at this timestamp
-        unique_incentives = row['incentive']
-        if isinstance(unique_incentives, (list, pd.Series)):
-            for incentive in unique_incentives:
-                if pd.notna(incentive):
-                    incentives.append({
-                        'timestamp': timestamp_str,
-                        'datetime': timestamp_str,
-                        'incentive': float(incentive)
-                    })
-        else:
-            if pd.notna(unique_incentives):
-                incentives.append({
-                    'timestamp': timestamp_str,
-                    'datetime': timestamp_str,
-                    'incentive': float(unique_incentives)
-                })
-    
-    # Sort by timestamp (ascending - oldest to newest), then by incentive (descending) to show highest values first
-    # Convert timestamp to datetime for proper sorting
-    def sort_key(x):
-        try:
-            ts = pd.to_datetime(x['timestamp'], utc=True)
-            return (ts, -x['incentive'])
-        except:
-            return (x['timestamp'], -x['incentive'])
-    
-    incentives.sort(key=sort_key)
+    # Unique incentive values for the latest `limit` timestamps, oldest to newest
+    incentives = _unique_values_history(df, timestamp_col, 'incentive', limit)
     
-    # Limit to requested number (take the most recent N)
-    incentives = incentives[-limit:]
-    
-    # Return in oldest-to-newest order for proper timeline display
     return {"incentives": incentives}
 
 
@@ -420,60 +561,9 @@ async def get_miner_trust(miner_name: str, limit: int = 50):
     if 'trust' not in df.columns:
         return {"trust": []}
     
-    # Get unique trust values per timestamp to show more data points
-    # Group by timestamp and get all unique trust values, sorted
-    grouped = df.groupby(timestamp_col)['trust'].apply(lambda x: sorted(x.unique(), reverse=True)).reset_index()
-    grouped = grouped.sort_values(timestamp_col, ascending=False).head(limit)
+    # Unique trust values for the latest `limit` timestamps, oldest to newest
+    trust_data = _unique_values_history(df, timestamp_col, 'trust', limit)
     
-    # Convert to list of dicts - create a point for each unique trust value
-    trust_data = []
-    for _, row in grouped.iterrows():
-        timestamp = row[timestamp_col]
-        if pd.isna(timestamp):
-            continue
-        
-        # Convert to ISO format
-        if isinstance(timestamp, pd.Timestamp):
-            timestamp_str = timestamp.isoformat()
-        else:
-            try:
-                ts = pd.to_datetime(timestamp, utc=True)
-                timestamp_str = ts.isoformat()
-            except:
-                continue
-        
-        # Add a point for each unique trust value at this timestamp
-        unique_trust = row['trust']
-        if isinstance(unique_trust, (list, pd.Series)):
-            for trust in unique_trust:
-                if pd.notna(trust):
-                    trust_data.append({
-                        'timestamp': timestamp_str,
-                        'datetime': timestamp_str,
-                        'trust': float(trust)
-                    })
-        else:
-            if pd.notna(unique_trust):
-                trust_data.append({
-                    'timestamp': timestamp_str,
-                    'datetime': timestamp_str,
-                    'trust': float(unique_trust)
-                })
-    
-    # Sort by timestamp (ascending - oldest to newest), then by trust (descending) to show highest values first
-    def sort_key(x):
-        try:
-            ts = pd.to_datetime(x['timestamp'], utc=True)
-            return (ts, -x['trust'])
-        except:
-            return (x['timestamp'], -x['trust'])
-    
-    trust_data.sort(key=sort_key)
-    
-    # Limit to requested number (take the most recent N)
-    trust_data = trust_data[-limit:]
-    
-    # Return in oldest-to-newest order for proper timeline display
     return {"trust": trust_data}
 
 
@@ -491,14 +581,13 @@ async def get_miner_data(miner_name: str):
     if df.empty:
         return {"data": []}
     
-    # Convert to dict
-    data = df.to_dict('records')
-    
-    return {"data": serialize_for_json(data)}
+    # Stream the records in encoded chunks, bypassing FastAPI's per-value jsonable_encoder walk
+    # (the generator runs in the threadpool, off the event loop)
+    return StreamingResponse(_stream_records_json(df, "data"), media_type="application/json")
 
 
 def _read_miner_incentive_csv(miner_name: str) -> pd.DataFrame:
-    """Read incentive history CSV file for a miner."""
+    """Read incentive history CSV file for a miner (cached until the file changes, do not modify the result)."""
     project_root = Path(__file__).parent.parent
     # Try my_incentive_history.csv first, fallback to incentive_history.csv
     csv_path = project_root / Config.MINER_DATA_DIR / miner_name / "my_incentive_history.csv"
@@ -510,25 +599,52 @@ def _read_miner_incentive_csv(miner_name: str) -> pd.DataFrame:
             return pd.DataFrame()
     
     try:
-        df = pd.read_csv(csv_path)
-        # Parse timestamp columns - handle ISO8601 format and mixed formats
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, format='ISO8601', errors='coerce')
-        if 'datetime' in df.columns:
-            df['datetime'] = pd.to_datetime(df['datetime'], utc=True, format='ISO8601', errors='coerce')
-        return df
+        return _read_csv_cached(csv_path)
     except Exception as e:
         logger.error(f"Error reading incentive CSV for {miner_name}: {e}")
         return pd.DataFrame()
 
 
+def _match_nearest(grid_ns: np.ndarray, times_ns: np.ndarray, values: list, max_diff_ns: int) -> list:
+    """
+    Match each grid time to the value at the nearest data time, if strictly within max_diff_ns.
+    
+    Args:
+        grid_ns: Grid times in int64 nanoseconds
+        times_ns: Data times in int64 nanoseconds, sorted ascending and unique
+        values: Value for each data time
+        max_diff_ns: Exclusive maximum distance for a match
+        
+    Returns:
+        List with the matched value (or None) for each grid time; on a tie the later
+        data time wins
+    """
+    if len(times_ns) == 0:
+        return [None] * len(grid_ns)
+    
+    no_match = np.iinfo(np.int64).max
+    # Binary search for the first data time at or after each grid time
+    after = np.searchsorted(times_ns, grid_ns)
+    after_idx = np.minimum(after, len(times_ns) - 1)
+    before_idx = np.maximum(after - 1, 0)
+    diff_after = np.where(after < len(times_ns), times_ns[after_idx] - grid_ns, no_match)
+    diff_before = np.where(after > 0, grid_ns - times_ns[before_idx], no_match)
+    
+    use_after = diff_after <= diff_before
+    best_idx = np.where(use_after, after_idx, before_idx)
+    matched = np.where(use_after, diff_after, diff_before) < max_diff_ns
+    
+    return [values[idx] if ok else None for idx, ok in zip(best_idx.tolist(), matched.tolist())]
+
+
 @app.get("/api/miners/incentives")
 async def get_all_miners_incentives(limit: int = 50):
     """Get incentive history for all miners, aggregated by timestamp."""
     all_miners = Config.get_all_miners()
     
     # Step 1: Collect all data points from all miners
-    all_miner_data: Dict[str, List[Dict]] = {}  # miner_name -> list of {timestamp, incentive}
+    # miner_name -> (timestamps as int64 ns, oldest first; max incentive per timestamp)
+    all_miner_data: Dict[str, Tuple[np.ndarray, List[float]]] = {}
     
     for miner_name in all_miners.keys():
         df = _read_miner_incentive_csv(miner_name)
@@ -540,78 +656,45 @@ async def get_all_miners_incentives(limit: int = 50):
         if timestamp_col not in df.columns:
             continue
         
-        # Group by timestamp and get max incentive per timestamp
-        grouped = df.groupby(timestamp_col)['incentive'].max().reset_index()
-        grouped = grouped.sort_values(timestamp_col, ascending=False)
+        # CSVParser parses the timestamps on load; unparseable ones become NaT and are dropped
+        timestamps = df[timestamp_col]
+        if not isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+            timestamps = pd.to_datetime(timestamps, utc=True, errors='coerce')
         
-        miner_data = []
-        for _, row in grouped.iterrows():
-            timestamp = row[timestamp_col]
-            if pd.isna(timestamp):
-                continue
-            
-            # Convert to datetime if needed
-            if isinstance(timestamp, pd.Timestamp):
-                ts = timestamp
-            else:
-                try:
-                    ts = pd.to_datetime(timestamp, utc=True)
-                except:
-                    continue
-            
-            incentive = row['incentive']
-            if pd.notna(incentive):
-                miner_data.append({
-                    'timestamp': ts,
-                    'incentive': float(incentive)
-                })
+        # Group by timestamp (sorted ascending, NaT dropped) and get max incentive per timestamp
+        incentives = df['incentive'].groupby(timestamps).max().dropna()
         
-        if miner_data:
-            all_miner_data[miner_name] = miner_data
+        if not incentives.empty:
+            all_miner_data[miner_name] = (
+                pd.DatetimeIndex(incentives.index).as_unit('ns').asi8,
+                incentives.astype(float).tolist(),
+            )
     
     if not all_miner_data:
         return {"data": [], "miners": list(all_miners.keys())}
     
-    # Step 2: Collect all unique timestamps and normalize to nearest 5 seconds
-    all_timestamps = set()
-    for miner_data in all_miner_data.values():
-        for point in miner_data:
-            ts = point['timestamp']
-            # Round to nearest 5 seconds
-            seconds = ts.second
-            rounded_seconds = (seconds // 5) * 5
-            normalized_ts = ts.replace(second=rounded_seconds, microsecond=0)
-            all_timestamps.add(normalized_ts)
+    # Step 2: Collect all unique timestamps and normalize to nearest 5 seconds (rounded down)
+    all_timestamps = pd.to_datetime(np.concatenate([times_ns for times_ns, _ in all_miner_data.values()]), utc=True)
+    sorted_timestamps = all_timestamps.floor('5s').unique().sort_values()
     
     # Step 3: For each normalized timestamp, find closest data from each miner (within 10 seconds)
-    sorted_timestamps = sorted(all_timestamps)
     recent_timestamps = sorted_timestamps[-limit:] if len(sorted_timestamps) > limit else sorted_timestamps
+    grid_ns = recent_timestamps.asi8
+    
+    matches: Dict[str, List[Optional[float]]] = {}
+    for miner_name, (times_ns, incentives) in all_miner_data.items():
+        matches[miner_name] = _match_nearest(grid_ns, times_ns, incentives, 10 * 10**9)
     
     chart_data = []
-    for normalized_ts in recent_timestamps:
+    for i, normalized_ts in enumerate(_isoformat_utc(recent_timestamps)):
         point: Dict[str, any] = {
-            'timestamp': normalized_ts.isoformat(),
-            'time': normalized_ts.isoformat()
+            'timestamp': normalized_ts,
+            'time': normalized_ts
         }
         
-        # For each miner, find the closest data point within 10 seconds
         for miner_name in all_miners.keys():
-            if miner_name not in all_miner_data:
-                continue
-            
-            miner_data = all_miner_data[miner_name]
-            best_match = None
-            min_diff_seconds = 10.0  # 10 second window
-            
-            for data_point in miner_data:
-                ts = data_point['timestamp']
-                diff_seconds = abs((ts - normalized_ts).total_seconds())
-                if diff_seconds < min_diff_seconds:
-                    min_diff_seconds = diff_seconds
-                    best_match = data_point
-            
-            if best_match:
-                point[miner_name] = best_match['incentive']
+            if miner_name in matches and matches[miner_name][i] is not None:
+                point[miner_name] = matches[miner_name][i]
         
         chart_data.append(point)
     
@@ -648,8 +731,10 @@ async def fetch_data(request: FetchDataRequest):
         
         # STEP 1: Collect all unique evaluation times across ALL miners
         # This allows us to share prices between miners and batch fetch
-        all_eval_times_by_asset = {}  # {asset: set(eval_times)} - shared across miners
-        miner_eval_times = {}  # {miner: {asset: [eval_times]}} - per miner tracking
+        all_eval_times_by_asset = {}  # {asset: [eval_times_ns arrays]} - shared across miners
+        miner_eval_times = {}  # {miner: {asset: [eval_times_ns arrays]}} - per miner tracking
+        miner_dfs: Dict[str, pd.DataFrame] = {}  # {miner: predictions} - read once, reused in STEP 3
+        miner_future_counts: Dict[str, int] = {}  # {miner: predictions not yet evaluable} - reported in STEP 3
         
         for miner in miners_to_fetch:
             if miner not in all_miners:
@@ -661,73 +746,59 @@ async def fetch_data(request: FetchDataRequest):
             if df.empty:
                 results[miner] = {"success": False, "error": "No data in CSV file"}
                 continue
+            miner_dfs[miner] = df
             
             csv_assets = CSVParser.detect_assets(df)
             
-            # Map CSV asset names to API asset names
-            api_asset_map = {
-                'btc': 'btc',
-                'eth': 'eth',
-                'tao_bittensor': 'tao',
-                'tao': 'tao',
-            }
-            
             # Collect evaluation times for this miner
             miner_eval_times[miner] = {}
             future_count = 0
             
             for csv_asset in csv_assets:
-                api_asset = api_asset_map.get(csv_asset.lower(), csv_asset.lower())
+                api_asset = _API_ASSETS.get(csv_asset.lower(), csv_asset.lower())
                 if api_asset not in all_eval_times_by_asset:
-                    all_eval_times_by_asset[api_asset] = set()
+                    all_eval_times_by_asset[api_asset] = []
                 if api_asset not in miner_eval_times[miner]:
                     miner_eval_times[miner][api_asset] = []
             
-            # Collect all evaluation times from this miner
-            for _, row in df.iterrows():
-                timestamp = row.get('timestamp') or row.get('datetime')
-                if not timestamp:
-                    continue
-                
-                if isinstance(timestamp, str):
-                    pred_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                else:
-                    pred_time = pd.Timestamp(timestamp).to_pydatetime()
-                    if pred_time.tzinfo is None:
-                        pred_time = pred_time.replace(tzinfo=timezone.utc)
-                
+            # Collect all evaluation times from this miner (vectorized over the rows)
+            timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
+            if timestamp_col in df.columns:
                 # Evaluation time is 1 hour after prediction
-                eval_time = pred_time + timedelta(hours=1)
+                eval_times = pd.DatetimeIndex(df[timestamp_col]) + pd.Timedelta(hours=1)
                 
-                # Only process if evaluation time has passed
-                if eval_time <= now:
-                    for csv_asset in csv_assets:
-                        pred_col = f"{csv_asset}_prediction"
-                        if pred_col not in row or pd.isna(row[pred_col]):
-                            continue
-                        
-                        api_asset = api_asset_map.get(csv_asset.lower(), csv_asset.lower())
-                        # Add to global set (shared across miners)
-                        all_eval_times_by_asset[api_asset].add(eval_time)
-                        # Also track per miner
-                        miner_eval_times[miner][api_asset].append(eval_time)
-                else:
-                    future_count += len(csv_assets)
+                # Only process if evaluation time has passed (NaT compares False)
+                evaluable = np.asarray(eval_times <= now)
+                future_count += int((~evaluable & eval_times.notna()).sum()) * len(csv_assets)
+                evaluable_times_ns = eval_times[evaluable].as_unit('ns').asi8
+                
+                for csv_asset in csv_assets:
+                    pred_col = f"{csv_asset}_prediction"
+                    has_prediction = df[pred_col].notna().to_numpy()[evaluable]
+                    times_ns = evaluable_times_ns[has_prediction]
+                    
+                    api_asset = _API_ASSETS.get(csv_asset.lower(), csv_asset.lower())
+                    # Add to global list (shared across miners)
+                    all_eval_times_by_asset[api_asset].append(times_ns)
+                    # Also track per miner
+                    miner_eval_times[miner][api_asset].append(times_ns)
+            
+            miner_future_counts[miner] = future_count
         
         # STEP 2: Batch load all unique prices from CSV files
         logger.info(f"🔄 Loading prices from CSV files for {len(all_eval_times_by_asset)} assets...")
-        all_prices = {}  # {asset: {eval_time: price}}
+        all_prices = {}  # {asset: (sorted unique eval_times_ns, price found mask)}
         
-        for api_asset, eval_times_set in all_eval_times_by_asset.items():
-            if not eval_times_set:
+        for api_asset, eval_time_arrays in all_eval_times_by_asset.items():
+            eval_times_ns = np.unique(np.concatenate(eval_time_arrays)) if eval_time_arrays else np.empty(0, dtype=np.int64)
+            if not len(eval_times_ns):
                 continue
             
-            eval_times_list = sorted(list(eval_times_set))
-            logger.info(f"   {api_asset.upper()}: Loading {len(eval_times_list)} unique prices from CSV (shared across all miners)")
+            logger.info(f"   {api_asset.upper()}: Loading {len(eval_times_ns)} unique prices from CSV (shared across all miners)")
             
             # Batch load all prices for this asset from CSV
-            prices = await PriceFetcher.fetch_prices_batch(api_asset, eval_times_list)
-            all_prices[api_asset] = prices
+            _, found = await PriceFetcher.fetch_prices_batch_arrays(api_asset, eval_times_ns)
+            all_prices[api_asset] = (eval_times_ns, found)
         
         # STEP 3: Calculate results per miner
         logger.info(f"📊 Calculating results per miner...")
@@ -737,35 +808,33 @@ async def fetch_data(request: FetchDataRequest):
                 results[miner] = {"success": False, "error": "Miner not found"}
                 continue
             
-            # Read CSV again to get time range info
-            df = _read_miner_csv(miner)
-            if df.empty:
+            # Reuse the predictions read in STEP 1 for the time range info
+            df = miner_dfs.get(miner)
+            if df is None:
                 results[miner] = {"success": False, "error": "No data in CSV file"}
                 continue
             
             fetched_count = 0
             failed_count = 0
             skipped_count = 0
-            future_count = 0
+            future_count = miner_future_counts.get(miner, 0)
             
             # Count prices for this miner
-            for api_asset, eval_times in miner_eval_times.get(miner, {}).items():
-                if api_asset not in all_prices:
+            for api_asset, eval_time_arrays in miner_eval_times.get(miner, {}).items():
+                if api_asset not in all_prices or not eval_time_arrays:
                     continue
                 
-                prices = all_prices[api_asset]
-                for eval_time in eval_times:
-                    price = prices.get(eval_time)
-                    if price is not None:
-                        fetched_count += 1
-                    else:
-                        failed_count += 1
+                # Look the miner's times up in the shared sorted unique times
+                eval_times_ns, found = all_prices[api_asset]
+                times_ns = np.concatenate(eval_time_arrays)
+                n_found = int(np.count_nonzero(found[np.searchsorted(eval_times_ns, times_ns)]))
+                fetched_count += n_found
+                failed_count += len(times_ns) - n_found
             
             # Calculate time range
             if not df.empty:
                 timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
                 if timestamp_col in df.columns:
-                    df[timestamp_col] = pd.to_datetime(df[timestamp_col], utc=True)
                     earliest_pred = df[timestamp_col].min()
                     latest_pred = df[timestamp_col].max()
                     earliest_eval = earliest_pred + timedelta(hours=1)
@@ -826,6 +895,37 @@ async def reload_prices():
         }
 
 
+def _parse_time_param(value: str) -> int:
+    """
+    Parse a start_time/end_time query parameter to UTC epoch nanoseconds.
+    
+    Args:
+        value: An ISO 8601 timestamp (UTC if no offset is given, compact forms such as
+            20240101 included), or epoch milliseconds
+        
+    Returns:
+        Epoch nanoseconds
+        
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if value.isdigit():
+        # Digits are a compact date when pandas can read them as one, epoch milliseconds otherwise
+        try:
+            return pd.to_datetime(value, utc=True).value
+        except ValueError:
+            return int(value) * 10**6
+    try:
+        # stdlib C parser for the well-formed ISO strings the frontend sends
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        # Other formats pandas understands
+        return pd.to_datetime(value, utc=True).value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return pd.Timestamp(parsed).value
+
+
 @app.get("/api/miners/{miner_name}/asset/{asset_name}")
 async def get_asset_data(
     miner_name: str, 
@@ -841,6 +941,9 @@ async def get_asset_data(
     - Reads predictions from CSV files
     - Looks up actual prices from CSV files (using in-memory cache)
     - Fast lookups from pre-loaded price cache
+    
+    start_time/end_time accept ISO 8601 strings (UTC if no offset is given) or epoch
+    milliseconds.
     """
     # Check if miner exists (either configured or discovered)
     all_miners = Config.get_all_miners()
@@ -861,27 +964,16 @@ async def get_asset_data(
         }
     
     # Normalize asset name
-    asset_map = {
-        'btc': 'btc',
-        'eth': 'eth',
-        'tao': 'tao_bittensor',
-        'tao_bittensor': 'tao_bittensor',
-    }
-    asset_key = asset_map.get(asset_name.lower(), asset_name)
+    asset_key = _ASSET_KEYS.get(asset_name.lower(), asset_name)
     
     # Map to API asset names (for price fetching)
-    api_asset_map = {
-        'btc': 'btc',
-        'eth': 'eth',
-        'tao': 'tao',
-        'tao_bittensor': 'tao',
-    }
-    api_asset = api_asset_map.get(asset_name.lower(), asset_name.lower())
+    api_asset = _API_ASSETS.get(asset_name.lower(), asset_name.lower())
     
     # Extract asset data from CSV
-    pred_col = f"{asset_key}_prediction"
-    lower_col = f"{asset_key}_interval_lower"
-    upper_col = f"{asset_key}_interval_upper"
+    columns = _ASSET_COLUMNS.get(asset_key)
+    if columns is None:
+        columns = (f"{asset_key}_prediction", f"{asset_key}_interval_lower", f"{asset_key}_interval_upper")
+    pred_col, lower_col, upper_col = columns
     
     if pred_col not in df.columns:
         return {
@@ -895,13 +987,6 @@ async def get_asset_data(
     
     # Prepare data
     now = datetime.now(timezone.utc)
-    chart_data = []
-    
-    # Collect data for metrics calculation
-    predictions_list = []
-    actuals_list = []
-    intervals_lower_list = []
-    intervals_upper_list = []
     
     # Track price fetching stats
     price_fetch_stats = {
@@ -915,114 +1000,106 @@ async def get_asset_data(
     # (miners handle up to 5 requests concurrently, resulting in multiple predictions per timestamp)
     timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'datetime'
     if timestamp_col in df.columns:
-        # Group by timestamp and take the first row for each timestamp
-        df_grouped = df.groupby(timestamp_col).first().reset_index()
-        # Sort by timestamp (most recent first)
-        df_sorted = df_grouped.sort_values(timestamp_col, ascending=False)
+        # One row per timestamp, oldest first (reused until the CSV changes)
+        df_sorted = _unique_rows_asc(miner_name, df, timestamp_col)
         
-        # Filter by time range if provided
+        # Filter by time range if provided (binary search over the sorted timestamps)
         if start_time or end_time:
+            times_ns = pd.DatetimeIndex(df_sorted[timestamp_col]).as_unit('ns').asi8
+            lo, hi = 0, len(times_ns)
             try:
                 if start_time:
-                    start_dt = pd.to_datetime(start_time, utc=True)
-                    df_sorted = df_sorted[df_sorted[timestamp_col] >= start_dt]
+                    lo = int(np.searchsorted(times_ns, _parse_time_param(start_time), side='left'))
                 if end_time:
-                    end_dt = pd.to_datetime(end_time, utc=True)
-                    df_sorted = df_sorted[df_sorted[timestamp_col] <= end_dt]
+                    hi = int(np.searchsorted(times_ns, _parse_time_param(end_time), side='right'))
             except Exception as e:
                 logger.warning(f"Error parsing time range: {e}")
+            df_sorted = df_sorted.iloc[lo:hi]
     else:
-        df_sorted = df.iloc[::-1]
+        df_sorted = df
     
-    # Process rows - now we get unique timestamps
-    # If time range is specified, use all matching rows; otherwise limit
+    # Process rows - now we get unique timestamps, oldest to newest
+    # If time range is specified, use all matching rows; otherwise the latest `limit`
     if start_time or end_time:
-        rows_to_process = df_sorted
+        rows = df_sorted
     else:
-        rows_to_process = df_sorted.head(limit)
+        rows = df_sorted.tail(limit)
     
-    for _, row in rows_to_process.iterrows():
-        timestamp = row.get('timestamp') or row.get('datetime')
-        if not timestamp:
-            continue
-        
-        if isinstance(timestamp, str):
-            pred_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        else:
-            pred_time = pd.Timestamp(timestamp).to_pydatetime()
-            if pred_time.tzinfo is None:
-                pred_time = pred_time.replace(tzinfo=timezone.utc)
-        
-        # Evaluation time is 1 hour after prediction
-        eval_time = pred_time + timedelta(hours=1)
-        
-        prediction = float(row[pred_col]) if pd.notna(row[pred_col]) else None
-        interval_lower = float(row[lower_col]) if lower_col in row and pd.notna(row[lower_col]) else None
-        interval_upper = float(row[upper_col]) if upper_col in row and pd.notna(row[upper_col]) else None
-        
-        data_point = {
-            'timestamp': pred_time.isoformat(),
-            'prediction_time': pred_time.isoformat(),
-            'evaluation_time': eval_time.isoformat(),
+    if timestamp_col in rows.columns:
+        pred_times = pd.DatetimeIndex(rows[timestamp_col])
+    else:
+        # Without a timestamp column there is nothing to plot
+        rows = rows.iloc[:0]
+        pred_times = pd.DatetimeIndex([], tz=timezone.utc)
+    
+    # Evaluation time is 1 hour after prediction
+    eval_times = pred_times + pd.Timedelta(hours=1)
+    evaluable = np.asarray(eval_times <= now)
+    
+    # float64 arrays with NaN for missing values (the JSON encoders write NaN as null)
+    predictions = _float_column(rows, pred_col)
+    intervals_lower = _float_column(rows, lower_col)
+    intervals_upper = _float_column(rows, upper_col)
+    
+    # Get actual prices from CSV (one batch lookup against the in-memory cache)
+    actual_prices = np.full(len(rows), np.nan)
+    n_evaluable = int(np.count_nonzero(evaluable))
+    if n_evaluable:
+        evaluable_times_ns = eval_times[evaluable].as_unit('ns').asi8
+        prices, _ = await PriceFetcher.fetch_prices_batch_arrays(api_asset, evaluable_times_ns)
+        actual_prices[evaluable] = prices
+    has_actual_price = ~np.isnan(actual_prices)
+    
+    n_found = int(np.count_nonzero(has_actual_price))
+    price_fetch_stats['total_evaluable'] = n_evaluable
+    price_fetch_stats['future'] = len(rows) - n_evaluable
+    if fetch_actuals:
+        price_fetch_stats['fetched'] = n_found
+        price_fetch_stats['failed'] = n_evaluable - n_found
+    elif n_found < n_evaluable:
+        price_fetch_stats['missing'] = n_evaluable - n_found
+    
+    pred_times_iso = _isoformat_utc(pred_times)
+    chart_data = [
+        {
+            'timestamp': pred_time,
+            'prediction_time': pred_time,
+            'evaluation_time': eval_time,
             'prediction': prediction,
             'interval_lower': interval_lower,
             'interval_upper': interval_upper,
-            'actual_price': None,
-            'has_actual': False,
+            'actual_price': actual_price,
+            'has_actual': has_actual,
         }
-        
-        # Get actual price from CSV (using in-memory cache)
-        if eval_time <= now:
-            price_fetch_stats['total_evaluable'] += 1
-            if fetch_actuals:
-                # Explicitly requested - load from CSV
-                actual_price = await PriceFetcher.get_price_at_time(api_asset, eval_time)
-                data_point['actual_price'] = actual_price
-                data_point['has_actual'] = actual_price is not None
-                
-                if actual_price is not None:
-                    price_fetch_stats['fetched'] += 1
-                else:
-                    price_fetch_stats['failed'] += 1
-            else:
-                # Not explicitly requested - try to load anyway (it's fast from cache)
-                actual_price = await PriceFetcher.get_price_at_time(api_asset, eval_time)
-                data_point['actual_price'] = actual_price
-                data_point['has_actual'] = actual_price is not None
-                if actual_price is None:
-                    price_fetch_stats['missing'] = price_fetch_stats.get('missing', 0) + 1
-        elif eval_time > now:
-            price_fetch_stats['future'] += 1
-        
-        # Collect for metrics (only if we have both prediction and actual)
-        if data_point['prediction'] is not None and data_point['actual_price'] is not None:
-            predictions_list.append(data_point['prediction'])
-            actuals_list.append(data_point['actual_price'])
-            if data_point['interval_lower'] is not None and data_point['interval_upper'] is not None:
-                intervals_lower_list.append(data_point['interval_lower'])
-                intervals_upper_list.append(data_point['interval_upper'])
-        
-        chart_data.append(data_point)
+        for pred_time, eval_time, prediction, interval_lower, interval_upper, actual_price, has_actual in zip(
+            pred_times_iso, _isoformat_utc(eval_times), predictions.tolist(),
+            intervals_lower.tolist(), intervals_upper.tolist(), actual_prices.tolist(),
+            has_actual_price.tolist(),
+        )
+    ]
     
-    # Reverse to show oldest to newest
-    chart_data.reverse()
+    # Collect for metrics (only if we have both prediction and actual), newest first
+    has_actual = (~np.isnan(predictions) & has_actual_price)[::-1]
+    has_interval = has_actual & ~np.isnan(intervals_lower[::-1]) & ~np.isnan(intervals_upper[::-1])
     
     # Calculate metrics
     metrics = MetricsCalculator.calculate_prediction_metrics(
-        predictions=predictions_list,
-        actuals=actuals_list,
-        intervals_lower=intervals_lower_list if intervals_lower_list else None,
-        intervals_upper=intervals_upper_list if intervals_upper_list else None
+        predictions=predictions[::-1][has_actual],
+        actuals=actual_prices[::-1][has_actual],
+        intervals_lower=intervals_lower[::-1][has_interval] if has_interval.any() else None,
+        intervals_upper=intervals_upper[::-1][has_interval] if has_interval.any() else None
     )
     
-    return {
+    # Encoded directly: the payload is plain JSON types, so FastAPI's jsonable_encoder walk
+    # over every chart point would only cost time
+    return Response(content=dumps_json_bytes({
         "miner_name": miner_name,
         "asset": asset_name,
         "data": chart_data,
         "count": len(chart_data),
         "metrics": metrics,
         "price_fetch_stats": price_fetch_stats,
-    }
+    }), media_type="application/json")
 
 
 @app.websocket("/ws")
@@ -1030,20 +1107,17 @@ async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
     try:
         await websocket.accept()
-        active_connections.append(websocket)
+        active_connections.add(websocket)
         logger.info(f"WebSocket client connected. Total connections: {len(active_connections)}")
         
         # Send initial data for all miners
         try:
             all_stats = await data_manager.get_all_miners_stats()
-            serialized_stats = serialize_for_json(all_stats) if all_stats else {}
-            # Verify it's JSON serializable before sending
-            import json
-            json.dumps(serialized_stats)  # This will raise if not serializable
-            await websocket.send_json({
+            # Encoded once (raises if not serializable) and sent as-is
+            await websocket.send_text(dumps_json({
                 'type': 'initial',
-                'data': serialized_stats
-            })
+                'data': all_stats or {}
+            }))
         except Exception as e:
             logger.warning(f"Error sending initial data: {e}")
         
@@ -1064,8 +1138,7 @@ async def websocket_endpoint(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket connection error: {e}")
     finally:
-        if websocket in active_connections:
-            active_connections.remove(websocket)
+        active_connections.discard(websocket)
         logger.info(f"WebSocket client disconnected. Total connections: {len(active_connections)}")
 
 
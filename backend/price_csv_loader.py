@@ -1,14 +1,46 @@
 """Load actual cryptocurrency prices from CSV files."""
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+import asyncio
+import hashlib
+import itertools
+import os
+import threading
+import time
+import numpy as np
 import pandas as pd
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, prices are then read with pandas from the CSV files only
+    pa = None
+    pa_csv = None
+    pq = None
+
 from backend.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Price file asset for each known asset name (CSV column prefix or API name)
+_ASSET_MAP = {
+    'tao_bittensor': 'tao',
+    'tao': 'tao',
+    'btc': 'btc',
+    'eth': 'eth',
+}
+
+
+@lru_cache(maxsize=32)
+def normalize_asset(asset: str) -> str:
+    """Map an asset name (any case) to its price file asset, e.g. 'TAO_BITTENSOR' -> 'tao' (cached)."""
+    asset_lower = asset.lower()
+    return _ASSET_MAP.get(asset_lower, asset_lower)
+
 
 class PriceCSVLoader:
     """Load actual prices from CSV files in the precog_lstm/data/real_price/ directory."""
@@ -35,14 +67,27 @@ class PriceCSVLoader:
     
     # Cache for loaded DataFrames (to avoid reloading on every request)
     _price_cache: Dict[str, pd.DataFrame] = {}
-    # Cache for price lookups: {asset: {rounded_timestamp: price}}
-    _price_lookup_cache: Dict[str, Dict[datetime, float]] = {}
+    # Cache for price lookups: {asset: close prices indexed by sorted, unique rounded timestamps}
+    _price_lookup_cache: Dict[str, pd.Series] = {}
+    # Evaluation times are rounded down to this step (5 minutes) before matching
+    ROUND_NS = 300 * 10**9
+    # Maximum distance for a closest-time match (5 minutes)
+    MAX_PRICE_DIFF_NS = 300 * 10**9
     # Cache for file modification times to detect updates
     _file_mtime_cache: Dict[str, float] = {}
+    # Per-asset locks serializing file loads
+    _load_locks: Dict[str, threading.Lock] = {}
+    # Load generation per asset, changes whenever its prices are (re)loaded
+    _price_generation: Dict[str, int] = {}
+    # Last time (monotonic) each asset's file was found unchanged or (re)loaded
+    _validated_at: Dict[str, float] = {}
+    # get_current_generation trusts a validated file for this long before checking it again
+    GENERATION_REVALIDATE_SECONDS = 5.0
+    _generation_counter = itertools.count(1)
     
     @classmethod
-    def _load_price_csv(cls, asset: str, force_reload: bool = False) -> Optional[pd.DataFrame]:
-        """Load price CSV file for an asset."""
+    def _find_price_csv(cls, asset: str) -> Optional[Path]:
+        """Get the price CSV file for an asset (None if the asset is unknown or the file is missing)."""
         if asset.lower() not in cls.ASSET_CSV_MAP:
             logger.warning(f"Unknown asset: {asset}")
             return None
@@ -61,28 +106,88 @@ class PriceCSVLoader:
             logger.warning(f"Price CSV file not found: {csv_file}")
             return None
         
-        # Check if file has been modified (if cached)
-        if not force_reload and asset.lower() in cls._price_cache:
-            try:
-                current_mtime = csv_file.stat().st_mtime
-                cached_mtime = cls._file_mtime_cache.get(asset.lower(), 0)
-                # If file hasn't changed, return cached version
-                if current_mtime <= cached_mtime:
-                    return cls._price_cache[asset.lower()]
-                else:
-                    # File has been updated, clear cache for this asset
-                    logger.info(f"🔄 Price CSV file {csv_file.name} has been updated, reloading...")
-                    del cls._price_cache[asset.lower()]
-                    if asset.lower() in cls._price_lookup_cache:
-                        del cls._price_lookup_cache[asset.lower()]
-            except Exception as e:
-                logger.debug(f"Error checking file modification time: {e}")
+        return csv_file
+    
+    @classmethod
+    def _load_price_csv(cls, asset: str, force_reload: bool = False) -> Optional[pd.DataFrame]:
+        """Load price CSV file for an asset."""
+        csv_file = cls._find_price_csv(asset)
+        if csv_file is None:
+            return None
+        
+        # Prefer a Parquet copy written next to the CSV (typed columns, only the ones we need),
+        # unless it is older than the CSV
+        parquet_file = csv_file.with_suffix('.parquet')
+        try:
+            if pq is not None and parquet_file.stat().st_mtime >= csv_file.stat().st_mtime:
+                csv_file = parquet_file
+        except OSError:
+            pass
+        
+        # Cached and unchanged: no lock needed, cache entries are replaced and never mutated
+        if not force_reload:
+            df = cls._get_cached_df(asset, csv_file)
+            if df is not None:
+                return df
+        
+        # One load per asset at a time (startup loads run in threads); other assets are not blocked
+        with cls._get_load_lock(asset):
+            # Another thread may have loaded the file while we waited
+            if not force_reload:
+                df = cls._get_cached_df(asset, csv_file)
+                if df is not None:
+                    return df
+            
+            if asset.lower() in cls._price_cache:
+                # File has been updated, clear cache for this asset
+                logger.info(f"🔄 Price CSV file {csv_file.name} has been updated, reloading...")
+                del cls._price_cache[asset.lower()]
+                if asset.lower() in cls._price_lookup_cache:
+                    del cls._price_lookup_cache[asset.lower()]
+            
+            return cls._read_price_file(asset, csv_file)
+    
+    @classmethod
+    def _get_load_lock(cls, asset: str) -> threading.Lock:
+        """Get the lock serializing loads of an asset's price file."""
+        lock = cls._load_locks.get(asset.lower())
+        if lock is None:
+            lock = cls._load_locks.setdefault(asset.lower(), threading.Lock())
+        return lock
+    
+    @classmethod
+    def _get_cached_df(cls, asset: str, csv_file: Path) -> Optional[pd.DataFrame]:
+        """Get the cached DataFrame for an asset if its file has not changed since it was loaded."""
+        df = cls._price_cache.get(asset.lower())
+        if df is None:
+            return None
         
-        # Load from file (or reload if cache was cleared)
         try:
-            df = pd.read_csv(csv_file)
+            current_mtime = csv_file.stat().st_mtime
+            cached_mtime = cls._file_mtime_cache.get(asset.lower(), 0)
+            # If file hasn't changed, return cached version
+            if current_mtime <= cached_mtime:
+                cls._validated_at[asset.lower()] = time.monotonic()
+                return df
+        except Exception as e:
+            logger.debug(f"Error checking file modification time: {e}")
+        return None
+    
+    @classmethod
+    def _read_price_file(cls, asset: str, csv_file: Path) -> Optional[pd.DataFrame]:
+        """Read an asset's price file (CSV or Parquet) and install it in the caches."""
+        try:
+            from_disk_cache = False
+            if csv_file.suffix == '.parquet':
+                table = pq.read_table(csv_file, columns=['timestamp', 'close'])
+                df = table.to_pandas(split_blocks=True, self_destruct=True)
+            else:
+                df = cls._read_column_cache(csv_file)
+                from_disk_cache = df is not None
+                if not from_disk_cache:
+                    df = cls._read_price_csv(csv_file)
             
-            # Parse timestamp column
+            # Parse timestamp column (only a UTC conversion for typed Parquet timestamps)
             if 'timestamp' in df.columns:
                 df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
             
@@ -91,8 +196,15 @@ class PriceCSVLoader:
                 logger.error(f"CSV file {csv_file} missing 'close' column")
                 return None
             
-            # Cache the DataFrame
-            cls._price_cache[asset.lower()] = df
+            # Keep the parsed columns on disk for the next cold start
+            if csv_file.suffix != '.parquet' and not from_disk_cache:
+                cls._write_column_cache(csv_file, df)
+            
+            # Build lookup cache for fast access
+            df['timestamp_rounded'] = df['timestamp'].dt.floor('5min')
+            cls._price_lookup_cache[asset.lower()] = cls._price_series(df)
+            cls._price_generation[asset.lower()] = next(cls._generation_counter)
+            cls._validated_at[asset.lower()] = time.monotonic()
             
             # Store file modification time
             try:
@@ -100,14 +212,8 @@ class PriceCSVLoader:
             except Exception:
                 pass
             
-            # Build lookup cache for fast access
-            df['timestamp_rounded'] = df['timestamp'].apply(
-                lambda dt: dt.replace(minute=(dt.minute // 5) * 5, second=0, microsecond=0)
-            )
-            lookup = {}
-            for _, row in df.iterrows():
-                lookup[row['timestamp_rounded']] = float(row['close'])
-            cls._price_lookup_cache[asset.lower()] = lookup
+            # Cache the DataFrame last: lock-free readers that find it also find its lookup cache
+            cls._price_cache[asset.lower()] = df
             
             logger.info(f"✅ Loaded {len(df)} price records from {csv_file}")
             return df
@@ -116,6 +222,155 @@ class PriceCSVLoader:
             logger.error(f"Error loading price CSV {csv_file}: {e}")
             return None
     
+    @staticmethod
+    def _read_price_csv(csv_file: Path) -> pd.DataFrame:
+        """
+        Read a price CSV file.
+        
+        With pyarrow only the timestamp and close columns are parsed, straight to UTC
+        timestamps and float64. Files Arrow rejects (e.g. timestamps without a zone offset
+        or no close column) are read with pandas.
+        """
+        if pa_csv is not None:
+            try:
+                convert_options = pa_csv.ConvertOptions(
+                    include_columns=['timestamp', 'close'],
+                    column_types={'timestamp': pa.timestamp('ns', 'UTC'), 'close': pa.float64()},
+                )
+                return pa_csv.read_csv(csv_file, convert_options=convert_options).to_pandas()
+            except (pa.ArrowInvalid, pa.ArrowKeyError) as e:
+                # ArrowKeyError: an included column (e.g. close) is missing
+                logger.debug(f"Arrow CSV reader failed for {csv_file}, falling back to pandas: {e}")
+        return pd.read_csv(csv_file)
+    
+    @staticmethod
+    def _column_cache_path(csv_file: Path) -> Optional[Path]:
+        """Get the on-disk column cache file for a price CSV (None if PRICE_CACHE_DIR is disabled)."""
+        cache_dir = Config.get_price_cache_dir()
+        if cache_dir is None:
+            return None
+        source_hash = hashlib.sha1(str(csv_file.resolve()).encode()).hexdigest()[:12]
+        return cache_dir / f"{csv_file.stem}_{source_hash}.npz"
+    
+    @classmethod
+    def _read_column_cache(cls, csv_file: Path) -> Optional[pd.DataFrame]:
+        """
+        Read the parsed timestamp/close columns of a price CSV from the on-disk cache.
+        
+        Returns:
+            DataFrame with UTC timestamp and float64 close columns, or None if there is no
+            cache entry or it was written for a different version of the CSV (mtime/size)
+        """
+        cache_path = cls._column_cache_path(csv_file)
+        if cache_path is None:
+            return None
+        
+        try:
+            stat = csv_file.stat()
+            with np.load(cache_path) as cached:
+                if int(cached['mtime_ns']) != stat.st_mtime_ns or int(cached['size']) != stat.st_size:
+                    return None
+                timestamps = cached['timestamp_ns']
+                close = cached['close']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable price cache {cache_path}: {e}")
+            return None
+        
+        logger.debug(f"Read {len(close)} cached price records for {csv_file.name} from {cache_path}")
+        return pd.DataFrame({
+            'timestamp': pd.DatetimeIndex(timestamps.view('datetime64[ns]')).tz_localize('UTC'),
+            'close': close,
+        })
+    
+    @classmethod
+    def _write_column_cache(cls, csv_file: Path, df: pd.DataFrame):
+        """Write the parsed timestamp/close columns of a price CSV to the on-disk cache (best effort)."""
+        cache_path = cls._column_cache_path(csv_file)
+        if cache_path is None:
+            return
+        
+        try:
+            stat = csv_file.stat()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial cache
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    timestamp_ns=pd.DatetimeIndex(df['timestamp']).as_unit('ns').asi8,
+                    close=df['close'].to_numpy(dtype=np.float64),
+                    mtime_ns=np.int64(stat.st_mtime_ns),
+                    size=np.int64(stat.st_size),
+                )
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write price cache {cache_path}: {e}")
+    
+    @staticmethod
+    def _price_series(df: pd.DataFrame) -> pd.Series:
+        """Build the close price Series indexed by sorted, unique rounded timestamps (ns)."""
+        prices = pd.Series(
+            df['close'].to_numpy(dtype=np.float64),
+            index=pd.DatetimeIndex(df['timestamp_rounded']).as_unit('ns'),
+        )
+        # Later rows win for the same rounded timestamp
+        prices = prices[prices.index.notna() & ~prices.index.duplicated(keep='last')]
+        return prices.sort_index(kind='stable')
+    
+    @classmethod
+    def get_current_generation(cls, asset: str) -> Optional[int]:
+        """
+        Get the load generation of an asset's prices.
+        
+        The file is checked for changes (and reloaded) only if it was last validated more
+        than GENERATION_REVALIDATE_SECONDS ago, so most calls are two dict reads.
+        
+        Returns:
+            Generation number (different after every reload), or None if no prices are loaded
+        """
+        validated_at = cls._validated_at.get(asset.lower())
+        if validated_at is None or time.monotonic() - validated_at >= cls.GENERATION_REVALIDATE_SECONDS:
+            df = cls._load_price_csv(asset)
+            if df is None or df.empty:
+                return None
+        return cls._price_generation.get(asset.lower())
+    
+    @classmethod
+    def _get_sorted_prices(cls, asset: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get a loaded asset's (timestamps as int64 ns, prices) arrays, views of the cached Series."""
+        prices = cls._price_lookup_cache.get(asset)
+        if prices is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        return prices.index.asi8, prices.to_numpy()
+    
+    @staticmethod
+    def _nearest_indices(sorted_ns: np.ndarray, query_ns: np.ndarray, max_diff_ns: int) -> np.ndarray:
+        """
+        Find the closest sorted timestamp for each query time (binary search).
+        
+        Args:
+            sorted_ns: Sorted timestamps as int64 nanoseconds
+            query_ns: Query times as int64 nanoseconds
+            max_diff_ns: Maximum allowed distance (inclusive)
+            
+        Returns:
+            Index into sorted_ns for each query, or -1 when nothing is within max_diff_ns.
+            On a tie the earlier timestamp wins.
+        """
+        n = len(sorted_ns)
+        if n == 0:
+            return np.full(len(query_ns), -1, dtype=np.int64)
+        
+        right = np.searchsorted(sorted_ns, query_ns, side='left')
+        left = right - 1
+        right_diff = np.where(right < n, sorted_ns[np.minimum(right, n - 1)] - query_ns, np.iinfo(np.int64).max)
+        left_diff = np.where(left >= 0, query_ns - sorted_ns[np.maximum(left, 0)], np.iinfo(np.int64).max)
+        
+        nearest = np.where(left_diff <= right_diff, left, right)
+        return np.where(np.minimum(left_diff, right_diff) <= max_diff_ns, nearest, -1)
+    
     @classmethod
     async def load_prices(cls, asset: str = None) -> Dict[str, int]:
         """
@@ -130,8 +385,12 @@ class PriceCSVLoader:
         assets_to_load = [asset] if asset else list(cls.ASSET_CSV_MAP.keys())
         results = {}
         
-        for asset_name in assets_to_load:
-            df = cls._load_price_csv(asset_name)
+        # Read the asset files concurrently, off the event loop (each asset has its own cache entries)
+        dfs = await asyncio.gather(*(
+            asyncio.to_thread(cls._load_price_csv, asset_name) for asset_name in assets_to_load
+        ))
+        
+        for asset_name, df in zip(assets_to_load, dfs):
             if df is None or df.empty:
                 results[asset_name] = 0
                 continue
@@ -148,6 +407,23 @@ class PriceCSVLoader:
         """
         Get price at a specific time from CSV file (using in-memory cache).
         
+        Args:
+            asset: Asset symbol (btc, eth, tao)
+            eval_time: Evaluation time
+            
+        Returns:
+            Price at that time, or None if not found
+        """
+        return cls.lookup_price(asset, eval_time)
+    
+    @classmethod
+    def lookup_price(cls, asset: str, eval_time: datetime) -> Optional[float]:
+        """
+        Synchronous get_price_at_time, for callers that do not need a coroutine per lookup.
+        
+        Reads the file first if it is not cached or has changed (blocking), like the async
+        version does.
+        
         Args:
             asset: Asset symbol (btc, eth, tao)
             eval_time: Evaluation time
@@ -156,13 +432,7 @@ class PriceCSVLoader:
             Price at that time, or None if not found
         """
         # Normalize asset name
-        asset_map = {
-            'tao_bittensor': 'tao',
-            'tao': 'tao',
-            'btc': 'btc',
-            'eth': 'eth',
-        }
-        api_asset = asset_map.get(asset.lower(), asset.lower())
+        api_asset = normalize_asset(asset)
         
         # Load CSV file (this will populate the cache)
         df = cls._load_price_csv(api_asset)
@@ -174,27 +444,17 @@ class PriceCSVLoader:
         rounded_minute = (eval_minute // 5) * 5
         eval_rounded = eval_time.replace(minute=rounded_minute, second=0, microsecond=0)
         
-        # Use lookup cache for fast access
-        lookup = cls._price_lookup_cache.get(api_asset, {})
+        # Exact match or closest match (within 5 minutes), binary search over the sorted times
+        sorted_ns, prices = cls._get_sorted_prices(api_asset)
+        query_ns = np.array([pd.Timestamp(eval_rounded).value], dtype=np.int64)
+        idx = int(cls._nearest_indices(sorted_ns, query_ns, cls.MAX_PRICE_DIFF_NS)[0])
         
-        # Try exact match first
-        if eval_rounded in lookup:
-            price = lookup[eval_rounded]
-            logger.debug(f"📦 Found {api_asset} price in CSV: ${price:.2f} at {eval_rounded}")
-            return price
-        
-        # Try to find closest match (within 5 minutes)
-        closest_time = None
-        min_diff = float('inf')
-        for price_time in lookup.keys():
-            diff = abs((price_time - eval_rounded).total_seconds())
-            if diff < min_diff and diff <= 300:  # Within 5 minutes
-                min_diff = diff
-                closest_time = price_time
-        
-        if closest_time is not None:
-            price = lookup[closest_time]
-            logger.debug(f"📦 Found closest {api_asset} price in CSV: ${price:.2f} at {closest_time}")
+        if idx >= 0:
+            price = float(prices[idx])
+            if sorted_ns[idx] == query_ns[0]:
+                logger.debug(f"📦 Found {api_asset} price in CSV: ${price:.2f} at {eval_rounded}")
+            else:
+                logger.debug(f"📦 Found closest {api_asset} price in CSV: ${price:.2f} at {pd.Timestamp(sorted_ns[idx], tz='UTC')}")
             return price
         
         logger.debug(f"❌ No {api_asset} price found in CSV for {eval_rounded}")
@@ -216,51 +476,117 @@ class PriceCSVLoader:
             return {}
         
         # Normalize asset name
-        asset_map = {
-            'tao_bittensor': 'tao',
-            'tao': 'tao',
-            'btc': 'btc',
-            'eth': 'eth',
-        }
-        api_asset = asset_map.get(asset.lower(), asset.lower())
+        api_asset = normalize_asset(asset)
         
         # Load CSV file (this will populate the cache)
         df = cls._load_price_csv(api_asset)
         if df is None or df.empty:
             return {}
         
-        # Use lookup cache for fast access
-        lookup = cls._price_lookup_cache.get(api_asset, {})
-        result = {}
+        eval_times_ns = pd.to_datetime(eval_times, utc=True).as_unit('ns').asi8
+        prices, found = cls._lookup_prices(api_asset, eval_times_ns)
         
-        # Round all times to nearest 5 minutes and look up prices
-        for eval_time in eval_times:
-            eval_minute = eval_time.minute
-            rounded_minute = (eval_minute // 5) * 5
-            rounded = eval_time.replace(minute=rounded_minute, second=0, microsecond=0)
+        return {
+            eval_time: price if has_price else None
+            for eval_time, price, has_price in zip(eval_times, prices.tolist(), found.tolist())
+        }
+    
+    @classmethod
+    async def fetch_prices_batch_arrays(cls, asset: str, eval_times_ns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch multiple prices at once from CSV file (using in-memory cache), as arrays.
+        
+        Args:
+            asset: Asset symbol (btc, eth, tao)
+            eval_times_ns: Evaluation times as int64 nanoseconds since the epoch (UTC), or a
+                datetime64 array of UTC times (any unit)
             
-            # Try exact match first
-            if rounded in lookup:
-                result[eval_time] = lookup[rounded]
-            else:
-                # Try to find closest match (within 5 minutes)
-                closest_time = None
-                min_diff = float('inf')
-                for price_time in lookup.keys():
-                    diff = abs((price_time - rounded).total_seconds())
-                    if diff < min_diff and diff <= 300:  # Within 5 minutes
-                        min_diff = diff
-                        closest_time = price_time
-                
-                if closest_time is not None:
-                    result[eval_time] = lookup[closest_time]
-                else:
-                    result[eval_time] = None
-        
-        found_count = sum(1 for v in result.values() if v is not None)
-        logger.debug(f"✅ {api_asset.upper()}: Found {found_count}/{len(eval_times)} prices from CSV cache")
-        
-        return result
+        Returns:
+            (prices, found): float64 prices aligned with eval_times_ns (NaN if not found) and a
+            boolean mask of the times a price was found for
+        """
+        eval_times_ns = np.asarray(eval_times_ns)
+        if np.issubdtype(eval_times_ns.dtype, np.datetime64):
+            eval_times_ns = eval_times_ns.astype('datetime64[ns]').view(np.int64)
+        else:
+            eval_times_ns = eval_times_ns.astype(np.int64, copy=False)
+        
+        # Normalize asset name
+        api_asset = normalize_asset(asset)
+        
+        # Load CSV file (this will populate the cache)
+        df = cls._load_price_csv(api_asset) if len(eval_times_ns) else None
+        if df is None or df.empty:
+            return np.full(len(eval_times_ns), np.nan), np.zeros(len(eval_times_ns), dtype=bool)
+        
+        return cls._lookup_prices(api_asset, eval_times_ns)
+    
+    @classmethod
+    def _lookup_prices(cls, api_asset: str, eval_times_ns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up a loaded asset's prices for evaluation times (int64 ns): (prices with NaN, found mask)."""
+        # Sorted price arrays for fast access
+        sorted_ns, prices = cls._get_sorted_prices(api_asset)
+        
+        # Round all times down to 5 minutes, then find the closest price time for all of them
+        # in one binary search (an exact match is the closest one)
+        rounded_ns = eval_times_ns - eval_times_ns % cls.ROUND_NS
+        indices = cls._nearest_indices(sorted_ns, rounded_ns, cls.MAX_PRICE_DIFF_NS)
+        
+        found = indices >= 0
+        result = np.where(found, prices[np.maximum(indices, 0)], np.nan)
+        
+        logger.debug(f"✅ {api_asset.upper()}: Found {int(np.count_nonzero(found))}/{len(eval_times_ns)} prices from CSV cache")
+        
+        return result, found
+    
+    @classmethod
+    def convert_to_parquet(cls, asset: str = None) -> Dict[str, Optional[str]]:
+        """
+        Write a zstd-compressed Parquet copy next to each price CSV file.
+        
+        The loader reads the copy instead of the CSV until the CSV is modified again, so
+        rerun this after the CSV files are updated.
+        
+        Args:
+            asset: Specific asset to convert (btc, eth, tao). If None, converts all assets.
+            
+        Returns:
+            Dictionary mapping asset -> written Parquet path (or None if failed)
+        """
+        if pq is None:
+            raise RuntimeError("pyarrow is required to write Parquet price files")
+        
+        assets_to_convert = [asset.lower()] if asset else list(cls.ASSET_CSV_MAP.keys())
+        results = {}
+        
+        for asset_name in assets_to_convert:
+            csv_file = cls._find_price_csv(asset_name)
+            if csv_file is None:
+                results[asset_name] = None
+                continue
+            
+            parquet_file = csv_file.with_suffix('.parquet')
+            try:
+                # All columns are kept, with the timestamps stored as UTC timestamps
+                try:
+                    convert_options = pa_csv.ConvertOptions(
+                        column_types={'timestamp': pa.timestamp('ns', 'UTC'), 'close': pa.float64()},
+                    )
+                    table = pa_csv.read_csv(csv_file, convert_options=convert_options)
+                except pa.ArrowInvalid:
+                    df = pd.read_csv(csv_file)
+                    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                pq.write_table(table, parquet_file, compression='zstd')
+            except Exception as e:
+                logger.error(f"Error converting price CSV {csv_file} to Parquet: {e}")
+                results[asset_name] = None
+                continue
+            
+            results[asset_name] = str(parquet_file)
+            logger.info(f"✅ Wrote {table.num_rows} {asset_name.upper()} price records to {parquet_file}")
+        
+        return results
     
     @classmethod
     def clear_cache(cls, asset: str = None):
@@ -273,10 +599,23 @@ class PriceCSVLoader:
                 del cls._price_lookup_cache[asset_lower]
             if asset_lower in cls._file_mtime_cache:
                 del cls._file_mtime_cache[asset_lower]
+            cls._price_generation.pop(asset_lower, None)
+            cls._validated_at.pop(asset_lower, None)
             logger.debug(f"Cleared price CSV cache for {asset}")
         else:
             cls._price_cache.clear()
             cls._price_lookup_cache.clear()
             cls._file_mtime_cache.clear()
+            cls._price_generation.clear()
+            cls._validated_at.clear()
             logger.debug("Cleared all price CSV cache")
+        
+        # Prices memoized from the cleared data (imported here, price_fetcher imports this module)
+        from backend.price_fetcher import PriceFetcher
+        PriceFetcher.clear_price_memo(asset)
+
 
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for asset_name, path in PriceCSVLoader.convert_to_parquet().items():
+        print(f"{asset_name}: {path or 'failed'}")
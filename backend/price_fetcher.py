@@ -1,9 +1,11 @@
 """Fetch actual cryptocurrency prices for evaluation (from CSV files)."""
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timezone, timedelta
 import logging
 
-from backend.price_csv_loader import PriceCSVLoader
+import numpy as np
+
+from backend.price_csv_loader import PriceCSVLoader, normalize_asset
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +13,11 @@ logger = logging.getLogger(__name__)
 class PriceFetcher:
     """Fetch actual prices from various sources."""
     
+    # Found prices per (asset, evaluation time), with the load generation they came from
+    _price_memo: Dict[Tuple[str, datetime], Tuple[int, float]] = {}
+    # Maximum number of memoized prices (FIFO: evicted in insertion order, hits do not refresh an entry)
+    MAX_PRICE_MEMO = 100_000
+    
     @staticmethod
     async def fetch_prices_batch(asset: str, eval_times: List[datetime]) -> Dict[datetime, Optional[float]]:
         """
@@ -23,21 +30,67 @@ class PriceFetcher:
         Returns:
             Dictionary mapping evaluation_time -> price (or None if failed)
         """
-        return await PriceCSVLoader.fetch_prices_batch(asset, eval_times)
+        return await PriceCSVLoader.fetch_prices_batch(normalize_asset(asset), eval_times)
     
     
+    @staticmethod
+    async def fetch_prices_batch_arrays(asset: str, eval_times_ns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch multiple prices at once from CSV files, without building a dict.
+        
+        Args:
+            asset: Asset symbol (btc, eth, tao)
+            eval_times_ns: Evaluation times as int64 nanoseconds since the epoch (UTC), or a
+                datetime64 array of UTC times (any unit)
+            
+        Returns:
+            (prices, found): float64 prices aligned with eval_times_ns (NaN if not found) and a
+            boolean mask of the times a price was found for
+        """
+        return await PriceCSVLoader.fetch_prices_batch_arrays(normalize_asset(asset), eval_times_ns)
+    
     @staticmethod
     async def get_price_at_time(asset: str, eval_time: datetime) -> Optional[float]:
         """Get actual price at evaluation time from CSV files (using in-memory cache)."""
-        # Normalize asset name
-        asset_map = {
-            'tao_bittensor': 'tao',
-            'tao': 'tao',
-            'btc': 'btc',
-            'eth': 'eth',
-        }
-        api_asset = asset_map.get(asset.lower(), asset.lower())
+        return PriceFetcher.get_price_at_time_sync(asset, eval_time)
+    
+    @staticmethod
+    def get_price_at_time_sync(asset: str, eval_time: datetime) -> Optional[float]:
+        """Synchronous get_price_at_time: memoized prices are returned without creating a coroutine."""
+        api_asset = normalize_asset(asset)
+        key = (api_asset, eval_time)
+        
+        # Memoized price, valid while the loader still holds the prices it was found in
+        # (a reload starts a new generation; the file is checked for changes at most every
+        # PriceCSVLoader.GENERATION_REVALIDATE_SECONDS)
+        memo = PriceFetcher._price_memo.get(key)
+        if memo is not None:
+            generation, price = memo
+            if generation == PriceCSVLoader.get_current_generation(api_asset):
+                return price
+            PriceFetcher._price_memo.pop(key, None)
         
         # Load from CSV (uses in-memory cache)
-        return await PriceCSVLoader.get_price_at_time(api_asset, eval_time)
+        price = PriceCSVLoader.lookup_price(api_asset, eval_time)
+        
+        # Only found prices are memoized, a missing one may still be appended to the file
+        if price is not None:
+            if len(PriceFetcher._price_memo) >= PriceFetcher.MAX_PRICE_MEMO:
+                del PriceFetcher._price_memo[next(iter(PriceFetcher._price_memo))]
+            generation = PriceCSVLoader.get_current_generation(api_asset)
+            if generation is not None:
+                PriceFetcher._price_memo[key] = (generation, price)
+        
+        return price
+    
+    @staticmethod
+    def clear_price_memo(asset: Optional[str] = None):
+        """Drop memoized prices (for one asset, or all)."""
+        if asset is None:
+            PriceFetcher._price_memo.clear()
+            return
+        
+        api_asset = normalize_asset(asset)
+        for key in [key for key in PriceFetcher._price_memo if key[0] == api_asset]:
+            del PriceFetcher._price_memo[key]
     